@@ -9,88 +9,103 @@ This example demonstrates how to use the QETL SDK to:
 """
 
 import os
+import time
+import asyncio
 from pathlib import Path
 import tempfile
 import yaml
 
+# Prefer the libyaml C emitter when PyYAML was built with it
+YAMLDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # Import QETL SDK components
 from qetl_sdk import QETLClient, JobBuilder
 
 
-def create_sample_yaml() -> Path:
-    """Create a sample YAML configuration for testing."""
-    config = {
-        "pipeline_name": "Molecular Analysis Pipeline",
-        "version": "1.0",
-        "description": "Sample quantum molecular analysis pipeline",
-        "input_sources": [
-            {
-                "name": "molecular_data",
-                "path": "data/molecules.sdf",
-                "type": "sdf"
+# Sample pipeline configuration used by the YAML submission example
+SAMPLE_CONFIG = {
+    "pipeline_name": "Molecular Analysis Pipeline",
+    "version": "1.0",
+    "description": "Sample quantum molecular analysis pipeline",
+    "input_sources": [
+        {
+            "name": "molecular_data",
+            "path": "data/molecules.sdf",
+            "type": "sdf"
+        }
+    ],
+    "transformations": [
+        {
+            "component": "wave_encoder",
+            "name": "encode_molecular_orbitals",
+            "config": {
+                "encoding_type": "molecular_orbital",
+                "precision": "high"
             }
-        ],
-        "transformations": [
-            {
-                "component": "wave_encoder",
-                "name": "encode_molecular_orbitals",
-                "config": {
-                    "encoding_type": "molecular_orbital",
-                    "precision": "high"
-                }
+        },
+        {
+            "component": "quantum_homology_analyzer",
+            "name": "analyze_topology",
+            "config": {
+                "dimensions": 4,
+                "precision": "high"
             },
-            {
-                "component": "quantum_homology_analyzer",
-                "name": "analyze_topology",
-                "config": {
-                    "dimensions": 4,
-                    "precision": "high"
-                },
-                "dependencies": ["encode_molecular_orbitals"]
+            "dependencies": ["encode_molecular_orbitals"]
+        },
+        {
+            "component": "williams_pebbler",
+            "name": "optimize_structure",
+            "config": {
+                "optimization_level": 2
             },
-            {
-                "component": "williams_pebbler",
-                "name": "optimize_structure",
-                "config": {
-                    "optimization_level": 2
-                },
-                "dependencies": ["analyze_topology"]
+            "dependencies": ["analyze_topology"]
+        },
+        {
+            "component": "holographic_grover",
+            "name": "search_patterns",
+            "config": {
+                "search_iterations": 1000
             },
-            {
-                "component": "holographic_grover",
-                "name": "search_patterns",
-                "config": {
-                    "search_iterations": 1000
-                },
-                "dependencies": ["optimize_structure"]
-            },
-            {
-                "component": "wave_decoder",
-                "name": "decode_results",
-                "config": {
-                    "decoding_type": "quantum_fourier"
-                },
-                "dependencies": ["search_patterns"]
-            }
-        ],
-        "outputs": [
-            {
-                "name": "analysis_results",
-                "path": "results/molecular_analysis.json",
-                "format": "json"
+            "dependencies": ["optimize_structure"]
+        },
+        {
+            "component": "wave_decoder",
+            "name": "decode_results",
+            "config": {
+                "decoding_type": "quantum_fourier"
             },
-            {
-                "name": "visualization_data",
-                "path": "results/visualization.csv",
-                "format": "csv"
-            }
-        ]
-    }
-    
-    # Create temporary YAML file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(config, f, default_flow_style=False)
-        return Path(f.name)
+            "dependencies": ["search_patterns"]
+        }
+    ],
+    "outputs": [
+        {
+            "name": "analysis_results",
+            "path": "results/molecular_analysis.json",
+            "format": "json"
+        },
+        {
+            "name": "visualization_data",
+            "path": "results/visualization.csv",
+            "format": "csv"
+        }
+    ]
+}
+
+# Serialized and encoded once at import; create_sample_yaml() writes the raw
+# bytes without going through a text-mode file wrapper
+SAMPLE_YAML_BYTES = yaml.dump(
+    SAMPLE_CONFIG, Dumper=YAMLDumper, default_flow_style=False, sort_keys=False
+).encode('utf-8')
+
+
+def create_sample_yaml() -> Path:
+    """Create a sample YAML configuration for testing."""
+    fd, path = tempfile.mkstemp(suffix='.yaml')
+    try:
+        os.write(fd, SAMPLE_YAML_BYTES)
+    finally:
+        os.close(fd)
+    return Path(path)
 
 
 def example_yaml_submission():
@@ -107,34 +122,33 @@ def example_yaml_submission():
         info = client.get_instance_info()
         print(f"Instance info: {info}")
         
+        # Validate the configuration while it is still in memory
+        print("Validating configuration...")
+        validation = client.validate_config(SAMPLE_CONFIG)
+        print(f"Validation result: {validation['message']}")
+        
         # Create sample YAML configuration
         yaml_path = create_sample_yaml()
         print(f"Created sample YAML: {yaml_path}")
         
         try:
-            # Validate YAML before submission
-            print("Validating YAML configuration...")
-            validation = client.validate_yaml(yaml_path)
-            print(f"Validation result: {validation['message']}")
-            
             # Submit job
             print("Submitting job...")
             job = client.submit_job(yaml_path)
             print(f"Job submitted! ID: {job.id}")
             print(f"Initial status: {job.status.state.value}")
             
-            # Monitor job progress
-            print("Monitoring job progress...")
-            while not job.is_complete():
-                status = job.get_status()
-                print(f"Status: {status.state.value} ({status.progress}%) - {status.message}")
-                
-                if job.is_complete():
-                    break
-                
-                # In a real scenario, you'd add a delay here
-                # time.sleep(5)
-                break  # For demo purposes, exit after first check
+            # Check job progress once; set QETL_POLL=1 to keep polling until
+            # the job finishes (see example 2 for the async alternative)
+            print("Checking job progress...")
+            status = job.get_status()
+            print(f"Status: {status.state.value} ({status.progress}%) - {status.message}")
+            
+            if os.environ.get("QETL_POLL") == "1":
+                while not status.is_terminal:
+                    time.sleep(5)
+                    status = job.get_status()
+                    print(f"Status: {status.state.value} ({status.progress}%) - {status.message}")
             
             # Get results if job completed successfully
             if job.is_successful():
@@ -154,9 +168,36 @@ def example_yaml_submission():
         print(f"Error: {e}")
 
 
+def example_async_monitoring():
+    """Example: Monitor a job asynchronously."""
+    print("\n=== Example 2: Async Job Monitoring ===")
+    
+    async def monitor(job):
+        async for status in job.watch(interval=2.0, timeout=3600):
+            print(f"Status: {status.state.value} ({status.progress}%) - {status.message}")
+        return job.status
+    
+    try:
+        client = QETLClient(mode="local")
+        
+        yaml_path = create_sample_yaml()
+        try:
+            job = client.submit_job(yaml_path)
+            print(f"Job submitted! ID: {job.id}")
+            
+            final_status = asyncio.run(monitor(job))
+            print(f"Final status: {final_status.state.value}")
+        finally:
+            if yaml_path.exists():
+                yaml_path.unlink()
+    
+    except Exception as e:
+        print(f"Error: {e}")
+
+
 def example_programmatic_job():
     """Example: Build and submit job programmatically."""
-    print("\n=== Example 2: Programmatic Job Building ===")
+    print("\n=== Example 3: Programmatic Job Building ===")
     
     try:
         # Create QETL client
@@ -188,6 +229,13 @@ def example_programmatic_job():
         print("\nGenerated YAML configuration:")
         yaml_config = builder.to_yaml()
         print(yaml_config)
+        
+        # Reuse the configuration as a template for a variant job
+        variant = (JobBuilder.from_config(client, builder.get_config())
+                   .set_name("Protein Structure Analysis (high priority)")
+                   .set_execution_params(priority=95, timeout=7200))
+        variant_job = variant.submit()
+        print(f"Variant job submitted! ID: {variant_job.id}")
     
     except Exception as e:
         print(f"Error: {e}")
@@ -195,11 +243,28 @@ def example_programmatic_job():
 
 def example_job_management():
     """Example: Job listing and management."""
-    print("\n=== Example 3: Job Management ===")
+    print("\n=== Example 4: Job Management ===")
     
     try:
         client = QETLClient(mode="local")
         
+        # Submit several jobs in one batch
+        yaml_paths = [create_sample_yaml() for _ in range(3)]
+        try:
+            print(f"Submitting batch of {len(yaml_paths)} jobs...")
+            batch = client.submit_jobs(yaml_paths)
+            print(f"Submitted {len(batch)} jobs")
+            
+            # Each job reads its YAML file when it starts running, so the
+            # files must stay in place until the jobs have finished
+            for job in batch:
+                status = job.wait_until_complete(timeout=300)
+                print(f"  - {job.id}: {status.state.value}")
+        finally:
+            for yaml_path in yaml_paths:
+                if yaml_path.exists():
+                    yaml_path.unlink()
+        
         # List all jobs
         print("Listing all jobs...")
         jobs = client.list_jobs(limit=10)
@@ -224,7 +289,7 @@ def example_job_management():
 
 def example_error_handling():
     """Example: Error handling."""
-    print("\n=== Example 4: Error Handling ===")
+    print("\n=== Example 5: Error Handling ===")
     
     try:
         client = QETLClient(mode="local")
@@ -263,13 +328,16 @@ def main():
         # Example 1: YAML submission
         example_yaml_submission()
         
-        # Example 2: Programmatic job building
+        # Example 2: Async job monitoring
+        example_async_monitoring()
+        
+        # Example 3: Programmatic job building
         example_programmatic_job()
         
-        # Example 3: Job management
+        # Example 4: Job management
         example_job_management()
         
-        # Example 4: Error handling
+        # Example 5: Error handling
         example_error_handling()
         
     except Exception as e:
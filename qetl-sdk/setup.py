@@ -3,7 +3,7 @@
 QETL SDK Setup Configuration
 """
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 
 # Read the README file for long description
@@ -36,7 +36,9 @@ setup(
         "Documentation": "https://docs.qetl.ai/sdk",
         "Source Code": "https://github.com/iconlabs/qetl-sdk",
     },
-    packages=find_packages(where="src"),
+    # Listed explicitly to avoid walking src/ on every build; update when
+    # adding a subpackage.
+    packages=["qetl_sdk"],
     package_dir={"": "src"},
     classifiers=[
         "Development Status :: 3 - Alpha",
@@ -84,7 +86,11 @@ setup(
             "boto3>=1.26.0",
             "azure-storage-blob>=12.0.0",
             "google-cloud-storage>=2.0.0",
-        ]
+        ],
+        "speedups": [
+            "orjson>=3.6.0",
+            "ciso8601>=2.2.0",
+        ],
     },
     entry_points={
         "console_scripts": [
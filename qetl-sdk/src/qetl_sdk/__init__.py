@@ -4,57 +4,84 @@ QETL SDK - Python SDK for QETL Quantum Processing Pipeline
 
 import sys
 import logging
-from pathlib import Path
+import importlib
+from typing import TYPE_CHECKING, Final, Tuple
+
+if TYPE_CHECKING:
+    from .client import QETLClient
 
 # Version check
 if sys.version_info < (3, 8):
     raise RuntimeError("qetl-sdk requires Python 3.8 or higher")
 
 # Package metadata
+# __version__ stays a plain literal so setuptools can read it statically;
+# keep VERSION_INFO in sync when bumping.
 __version__ = "1.0.0"
 __author__ = "QETL Development Team"
 __email__ = "dev@qetl.io"
 __description__ = "Python SDK for QETL Quantum Processing Pipeline"
 
-# Core imports
-try:
-    from .client import QETLClient
-    from .job import Job, JobStatus, JobResults, JobState
-    from .builder import JobBuilder
-    from .exceptions import (
-        QETLError,
-        AuthenticationError,
-        AuthorizationError,
-        ValidationError,
-        JobExecutionError,
-        TimeoutError,
-        ConfigurationError,
-        ComponentNotFoundError,
-        JobNotFoundError,
-        NetworkError,
-        RateLimitError,
-        QuotaExceededError
-    )
-except ImportError as e:
-    # Handle import errors gracefully during development/testing
-    import warnings
-    warnings.warn(f"Could not import all QETL SDK components: {e}")
+# Core exports are imported lazily on first attribute access (PEP 562) so
+# that ``import qetl_sdk`` does not pull in the backends and their
+# dependencies until they are actually used.
+_LAZY_IMPORTS = {
+    "QETLClient": ".client",
+    "Job": ".job",
+    "JobStatus": ".job",
+    "JobResults": ".job",
+    "JobState": ".job",
+    "JobBuilder": ".builder",
+    "QETLError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "AuthorizationError": ".exceptions",
+    "ValidationError": ".exceptions",
+    "JobExecutionError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "ConfigurationError": ".exceptions",
+    "ComponentNotFoundError": ".exceptions",
+    "JobNotFoundError": ".exceptions",
+    "NetworkError": ".exceptions",
+    "RateLimitError": ".exceptions",
+    "QuotaExceededError": ".exceptions",
+}
+
+
+def __getattr__(name: str):
+    """Import core exports on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
     
-    # Define minimal exports for partial imports
-    from .exceptions import QETLError
+    try:
+        module = importlib.import_module(module_name, __name__)
+    except ImportError as e:
+        # Handle import errors gracefully during development/testing
+        import warnings
+        warnings.warn(f"Could not import QETL SDK component {name}: {e}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from e
+    
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily imported exports in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # Setup default logging
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 # Version info tuple
-VERSION_INFO = tuple(int(x) for x in __version__.split('.') if x.isdigit())
+VERSION_INFO: Final[Tuple[int, int, int]] = (1, 0, 0)
 
 # Convenience functions
 def get_version() -> str:
     """Get the current version string."""
     return __version__
 
-def get_version_info() -> tuple:
+def get_version_info() -> Tuple[int, int, int]:
     """Get the current version as a tuple."""
     return VERSION_INFO
 
@@ -68,10 +95,11 @@ def create_client(mode: str = "local", **kwargs) -> "QETLClient":
     Returns:
         QETLClient instance
     """
+    from .client import QETLClient
     return QETLClient(mode=mode, **kwargs)
 
 # All exports
-__all__ = [
+__all__: Final[Tuple[str, ...]] = (
     # Version and metadata
     "__version__",
     "VERSION_INFO",
@@ -101,5 +129,5 @@ __all__ = [
     "JobNotFoundError",
     "NetworkError",
     "RateLimitError",
-    "QuotaExceededError"
-]
+    "QuotaExceededError",
+)
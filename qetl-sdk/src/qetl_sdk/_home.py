@@ -0,0 +1,61 @@
+"""
+QETL installation lookup shared by the client and the local runner
+"""
+
+import os
+from typing import Dict, Optional
+
+# Files that mark the root of a QETL installation; LocalRunner requires both
+MARKER_FILES = (
+    os.path.join("core", "quantum_mathematics_engine.py"),
+    os.path.join("yaml_pipeline_runner", "main.py"),
+)
+
+# Installations found so far, keyed by starting directory. Failed searches
+# are not cached, so an installation created later is still found.
+_found_homes: Dict[str, str] = {}
+
+
+def search_qetl_home(start_dir: str) -> Optional[str]:
+    """
+    Walk up from a directory looking for a QETL installation.
+
+    The walk stops at the first directory containing a QETL marker file.
+    Successful searches are cached per starting directory, so clients and
+    runners created from the same working directory only walk the
+    filesystem once.
+
+    Args:
+        start_dir: Absolute directory to start from
+
+    Returns:
+        Path to QETL installation or None if not found
+    """
+    home = _found_homes.get(start_dir)
+    if home is not None:
+        return home
+
+    path = start_dir
+    while not any(os.path.isfile(os.path.join(path, marker)) for marker in MARKER_FILES):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+    _found_homes[start_dir] = path
+    return path
+
+
+def find_qetl_home() -> Optional[str]:
+    """
+    Locate the QETL installation to use.
+
+    The ``QETL_HOME`` environment variable wins; otherwise the current
+    directory and its parents are searched.
+
+    Returns:
+        Path to QETL installation or None if not found
+    """
+    if "QETL_HOME" in os.environ:
+        return os.environ["QETL_HOME"]
+    return search_qetl_home(os.getcwd())
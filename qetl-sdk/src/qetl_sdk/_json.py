@@ -0,0 +1,66 @@
+"""
+JSON helpers - Use orjson when it is installed, falling back to the stdlib
+"""
+
+import json
+from datetime import date, datetime
+from pathlib import PurePath
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the non-JSON values the SDK writes: datetimes and paths."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON.
+
+    Datetimes are written in ISO 8601 format and paths as strings.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON document as bytes
+
+    Raises:
+        TypeError: If the object contains any other non-JSON value
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+
+    if indent:
+        text = json.dumps(obj, indent=2, default=_default)
+    else:
+        text = json.dumps(obj, separators=(",", ":"), default=_default)
+    return text.encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
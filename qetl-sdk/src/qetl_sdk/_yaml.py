@@ -0,0 +1,149 @@
+"""
+YAML helpers - Prefer the libyaml C bindings when PyYAML was built with them
+"""
+
+import copy
+import functools
+import io
+import os
+from pathlib import Path
+from typing import Any, IO, Optional, Union
+
+import yaml
+
+from .exceptions import ValidationError
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as _BaseDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader, SafeDumper as _BaseDumper
+
+YAMLError = yaml.YAMLError
+
+
+class SafeDumper(_BaseDumper):
+    """
+    Safe dumper with the SDK's output options and representers preset.
+    
+    Mappings are written in block style and keep their insertion order,
+    so ``SafeDumper(stream)`` needs no per-call options.
+    """
+    
+    def __init__(self, stream, default_flow_style=False, sort_keys=False, **kwargs):
+        super().__init__(
+            stream,
+            default_flow_style=default_flow_style,
+            sort_keys=sort_keys,
+            **kwargs
+        )
+
+
+# Tuples (e.g. dependencies=("a", "b")) are written as plain YAML lists
+SafeDumper.add_representer(tuple, SafeDumper.represent_list)
+
+
+def safe_load(stream: Union[str, bytes, IO]) -> Any:
+    """
+    Parse a YAML document using the fastest available safe loader.
+
+    Args:
+        stream: YAML text, bytes or an open file object
+
+    Returns:
+        Parsed Python object
+    """
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def load_config_file(path: Union[str, Path]) -> Any:
+    """
+    Parse a YAML job configuration file.
+    
+    The file is opened in binary mode and handed to the loader directly,
+    so the document is neither read into an intermediate string nor
+    decoded by Python's text layer; the loader detects the encoding itself.
+    
+    Args:
+        path: Path to the YAML configuration file
+        
+    Returns:
+        Parsed configuration
+        
+    Raises:
+        ValidationError: If the file is missing or is not valid YAML
+    """
+    try:
+        with open(path, 'rb') as f:
+            return safe_load(f)
+    except YAMLError as e:
+        raise ValidationError(f"Invalid YAML format: {e}")
+    except FileNotFoundError:
+        raise ValidationError(f"YAML file not found: {path}")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_version(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse one version of a configuration file; the stat fields are the cache key."""
+    return load_config_file(path)
+
+
+def load_config_file_cached(path: Union[str, Path]) -> Any:
+    """
+    Parse a YAML job configuration file, reusing the result while it is unchanged.
+    
+    The file's modification time and size are part of the cache key, so
+    editing the file invalidates its entry and resubmitting an unchanged
+    file costs a ``stat`` and a copy of the cached parse. Each call returns
+    its own copy, so callers may modify the result.
+    
+    Args:
+        path: Path to the YAML configuration file
+        
+    Returns:
+        Parsed configuration
+        
+    Raises:
+        ValidationError: If the file is missing or is not valid YAML
+    """
+    path = os.fspath(path)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise ValidationError(f"YAML file not found: {path}")
+    return copy.deepcopy(_load_config_version(path, stat.st_mtime_ns, stat.st_size))
+
+
+def safe_dump(data: Any, stream: Optional[IO] = None, **kwargs) -> Optional[str]:
+    """
+    Serialize data to YAML using the fastest available safe dumper.
+    
+    Mappings are written in block style and keep their insertion order
+    unless overridden through ``kwargs``.
+    
+    Args:
+        data: Python object to serialize
+        stream: Optional file object to write to
+        **kwargs: Extra options passed to ``yaml.dump``
+        
+    Returns:
+        YAML string if no stream was given, otherwise None
+    """
+    if kwargs:
+        kwargs.setdefault("default_flow_style", False)
+        kwargs.setdefault("sort_keys", False)
+        return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+    
+    # Common case: drive the preset dumper directly instead of going
+    # through yaml.dump()'s option handling
+    output = io.StringIO() if stream is None else stream
+    dumper = SafeDumper(output)
+    try:
+        dumper.open()
+        dumper.represent(data)
+        dumper.close()
+    finally:
+        dumper.dispose()
+    
+    if stream is None:
+        return output.getvalue()
+    return None
@@ -2,14 +2,47 @@
 Job Builder - Programmatic job construction using builder pattern
 """
 
-import yaml
-from typing import Dict, Any, List, Optional, Union
+import io
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple, Union
 from pathlib import Path
-import tempfile
 
+from . import _yaml
 from .job import Job
 from .exceptions import ValidationError
 
+# Configuration every new builder starts from; the tuples mark the sections
+# each builder gets its own list for
+_DEFAULT_CONFIG = MappingProxyType({
+    "pipeline_name": "Programmatic Pipeline",
+    "version": "1.0",
+    "input_sources": (),
+    "transformations": (),
+    "outputs": (),
+})
+
+
+def _new_config() -> Dict[str, Any]:
+    """Build a fresh configuration from ``_DEFAULT_CONFIG``."""
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in _DEFAULT_CONFIG.items()
+    }
+
+
+# Configuration sections holding one dict per source, transformation or output
+_ENTRY_SECTIONS = ("input_sources", "transformations", "outputs")
+
+
+def _copy_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a section entry along with its ``config`` and ``dependencies``."""
+    entry = dict(entry)
+    if isinstance(entry.get("config"), dict):
+        entry["config"] = dict(entry["config"])
+    if isinstance(entry.get("dependencies"), (list, tuple)):
+        entry["dependencies"] = list(entry["dependencies"])
+    return entry
+
 
 class JobBuilder:
     """
@@ -19,16 +52,54 @@ class JobBuilder:
     without manually writing YAML.
     """
     
+    __slots__ = (
+        "_client", "_config", "_execution_params",
+        "_transformation_names", "_version", "_yaml_cache",
+    )
+    
     def __init__(self, client):
         self._client = client
-        self._config = {
-            "pipeline_name": "Programmatic Pipeline",
-            "version": "1.0",
-            "input_sources": [],
-            "transformations": [],
-            "outputs": []
-        }
+        self._config = _new_config()
         self._execution_params = {}
+        # Names of the transformations added so far, for dependency checks
+        self._transformation_names: Set[str] = set()
+        # Bumped by every mutator so to_yaml() can reuse its last output
+        self._version = 0
+        self._yaml_cache: Optional[Tuple[int, str]] = None
+    
+    @classmethod
+    def from_config(cls, client, config: Dict[str, Any]) -> "JobBuilder":
+        """
+        Create a builder from a complete configuration dictionary.
+        
+        The configuration uses the same layout as the YAML file and
+        ``get_config()``; an ``execution`` section becomes the execution
+        parameters. Useful for generating many jobs from one template
+        without replaying individual ``add_*`` calls.
+        
+        Args:
+            client: QETL client used for submission
+            config: Job configuration dictionary
+            
+        Returns:
+            New JobBuilder instance
+        """
+        builder = cls(client)
+        config = dict(config)
+        builder._execution_params = dict(config.pop("execution", None) or {})
+        builder._config.update(config)
+        
+        # The builder appends to these, so it must own the lists
+        for key in _ENTRY_SECTIONS:
+            builder._config[key] = list(builder._config.get(key) or [])
+        
+        builder._transformation_names = {
+            transform["name"]
+            for transform in builder._config["transformations"]
+            if "name" in transform
+        }
+        
+        return builder
     
     def set_name(self, name: str) -> "JobBuilder":
         """
@@ -41,6 +112,7 @@ class JobBuilder:
             Self for chaining
         """
         self._config["pipeline_name"] = name
+        self._version += 1
         return self
     
     def set_version(self, version: str) -> "JobBuilder":
@@ -54,6 +126,7 @@ class JobBuilder:
             Self for chaining
         """
         self._config["version"] = version
+        self._version += 1
         return self
     
     def set_description(self, description: str) -> "JobBuilder":
@@ -67,6 +140,7 @@ class JobBuilder:
             Self for chaining
         """
         self._config["description"] = description
+        self._version += 1
         return self
     
     def add_input_source(
@@ -100,6 +174,7 @@ class JobBuilder:
             source["config"] = config
         
         self._config["input_sources"].append(source)
+        self._version += 1
         return self
     
     def add_transformation(
@@ -127,6 +202,7 @@ class JobBuilder:
         
         if name:
             transformation["name"] = name
+            self._transformation_names.add(name)
         
         if config:
             transformation["config"] = config
@@ -135,6 +211,7 @@ class JobBuilder:
             transformation["dependencies"] = dependencies
         
         self._config["transformations"].append(transformation)
+        self._version += 1
         return self
     
     def add_output(
@@ -166,6 +243,106 @@ class JobBuilder:
             output["config"] = config
         
         self._config["outputs"].append(output)
+        self._version += 1
+        return self
+    
+    def extend_input_sources(self, sources: Iterable[Dict[str, Any]]) -> "JobBuilder":
+        """
+        Add several input sources at once.
+        
+        Args:
+            sources: Input source dictionaries in the YAML layout
+                (``name``, ``path``, ``type`` and optional ``config``)
+            
+        Returns:
+            Self for chaining
+        """
+        self._config["input_sources"].extend(sources)
+        self._version += 1
+        return self
+    
+    def extend_transformations(self, transformations: Iterable[Dict[str, Any]]) -> "JobBuilder":
+        """
+        Add several transformations at once.
+        
+        Args:
+            transformations: Transformation dictionaries in the YAML layout
+                (``component`` and optional ``name``, ``config``, ``dependencies``)
+            
+        Returns:
+            Self for chaining
+        """
+        transformations = list(transformations)
+        self._config["transformations"].extend(transformations)
+        self._transformation_names.update(
+            transform["name"] for transform in transformations if "name" in transform
+        )
+        self._version += 1
+        return self
+    
+    def extend_outputs(self, outputs: Iterable[Dict[str, Any]]) -> "JobBuilder":
+        """
+        Add several outputs at once.
+        
+        Args:
+            outputs: Output dictionaries in the YAML layout
+                (``name``, ``path``, ``format`` and optional ``config``)
+            
+        Returns:
+            Self for chaining
+        """
+        self._config["outputs"].extend(outputs)
+        self._version += 1
+        return self
+    
+    def configure(
+        self,
+        name: Optional[str] = None,
+        version: Optional[str] = None,
+        description: Optional[str] = None,
+        input_sources: Optional[Iterable[Dict[str, Any]]] = None,
+        transformations: Optional[Iterable[Dict[str, Any]]] = None,
+        outputs: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> "JobBuilder":
+        """
+        Set several configuration fields in a single call.
+        
+        Equivalent to chaining ``set_name``, ``set_version``,
+        ``set_description`` and the ``extend_*`` methods; arguments left as
+        None are not changed.
+        
+        Args:
+            name: Pipeline name
+            version: Version string
+            description: Description text
+            input_sources: Input source dictionaries in the YAML layout
+            transformations: Transformation dictionaries in the YAML layout
+            outputs: Output dictionaries in the YAML layout
+            
+        Returns:
+            Self for chaining
+        """
+        config = self._config
+        
+        if name is not None:
+            config["pipeline_name"] = name
+        if version is not None:
+            config["version"] = version
+        if description is not None:
+            config["description"] = description
+        
+        if input_sources is not None:
+            config["input_sources"].extend(input_sources)
+        if transformations is not None:
+            transformations = list(transformations)
+            config["transformations"].extend(transformations)
+            self._transformation_names.update(
+                transform["name"] for transform in transformations if "name" in transform
+            )
+        if outputs is not None:
+            config["outputs"].extend(outputs)
+        
+        self._version += 1
         return self
     
     def set_execution_params(
@@ -193,6 +370,7 @@ class JobBuilder:
         if notifications:
             self._execution_params["notifications"] = notifications
         
+        self._version += 1
         return self
     
     def add_quantum_homology_analyzer(
@@ -214,15 +392,9 @@ class JobBuilder:
         Returns:
             Self for chaining
         """
-        config = {
-            "dimensions": dimensions,
-            "precision": precision,
-            **kwargs
-        }
-        
         return self.add_transformation(
             "quantum_homology_analyzer",
-            config=config,
+            config={"dimensions": dimensions, "precision": precision, **kwargs},
             name=name
         )
     
@@ -243,14 +415,9 @@ class JobBuilder:
         Returns:
             Self for chaining
         """
-        config = {
-            "optimization_level": optimization_level,
-            **kwargs
-        }
-        
         return self.add_transformation(
             "williams_pebbler",
-            config=config,
+            config={"optimization_level": optimization_level, **kwargs},
             name=name
         )
     
@@ -273,14 +440,9 @@ class JobBuilder:
         Returns:
             Self for chaining
         """
-        config = {
-            "search_iterations": search_iterations,
-            **kwargs
-        }
-        
         return self.add_transformation(
             "holographic_grover",
-            config=config,
+            config={"search_iterations": search_iterations, **kwargs},
             name=name,
             dependencies=dependencies
         )
@@ -302,14 +464,9 @@ class JobBuilder:
         Returns:
             Self for chaining
         """
-        config = {
-            "encoding_type": encoding_type,
-            **kwargs
-        }
-        
         return self.add_transformation(
             "wave_encoder",
-            config=config,
+            config={"encoding_type": encoding_type, **kwargs},
             name=name
         )
     
@@ -330,14 +487,9 @@ class JobBuilder:
         Returns:
             Self for chaining
         """
-        config = {
-            "decoding_type": decoding_type,
-            **kwargs
-        }
-        
         return self.add_transformation(
             "wave_decoder",
-            config=config,
+            config={"decoding_type": decoding_type, **kwargs},
             name=name
         )
     
@@ -363,25 +515,20 @@ class JobBuilder:
         if not self._config.get("transformations"):
             errors.append("At least one transformation is required")
             
-        # Validate dependencies
-        transformation_names = set()
-        for transform in self._config.get("transformations", []):
-            if "name" in transform:
-                transformation_names.add(transform["name"])
-        
-        for transform in self._config.get("transformations", []):
-            # Check dependencies at the transformation level
-            dependencies = transform.get("dependencies", [])
-            if isinstance(dependencies, list):
-                for dep in dependencies:
-                    if dep not in transformation_names:
-                        errors.append(f"Unknown dependency: {dep}")
-            # Also check dependencies in config if they exist there
-            config_deps = transform.get("config", {}).get("dependencies", [])
-            if isinstance(config_deps, list):
-                for dep in config_deps:
-                    if dep not in transformation_names:
-                        errors.append(f"Unknown dependency: {dep}")
+        # Validate dependencies, declared either on the transformation
+        # itself or inside its config
+        transformation_names = self._transformation_names
+        errors.extend(
+            f"Unknown dependency: {dep}"
+            for transform in self._config.get("transformations", [])
+            for dependencies in (
+                transform.get("dependencies"),
+                (transform.get("config") or {}).get("dependencies")
+            )
+            if isinstance(dependencies, list)
+            for dep in dependencies
+            if dep not in transformation_names
+        )
         
         if errors:
             error_msg = "; ".join(errors)
@@ -393,15 +540,31 @@ class JobBuilder:
         """
         Export job configuration as YAML string.
         
+        The result is cached until the builder is next modified through one
+        of its methods; dicts passed in as ``config`` should not be mutated
+        afterwards.
+        
         Returns:
             YAML configuration string
         """
-        config = self._config.copy()
+        if self._yaml_cache is not None and self._yaml_cache[0] == self._version:
+            return self._yaml_cache[1]
         
-        if self._execution_params:
-            config["execution"] = self._execution_params
+        yaml_str = _yaml.safe_dump(self._export_config())
+        self._yaml_cache = (self._version, yaml_str)
+        return yaml_str
+    
+    def to_yaml_stream(self) -> io.BytesIO:
+        """
+        Export job configuration as an in-memory UTF-8 YAML stream.
         
-        return yaml.dump(config, default_flow_style=False, sort_keys=False)
+        Useful for APIs that take a file object (uploads, archives) without
+        writing the configuration to disk first.
+        
+        Returns:
+            BytesIO positioned at the start of the YAML document
+        """
+        return io.BytesIO(self.to_yaml().encode("utf-8"))
     
     def save_yaml(self, filepath: Union[str, Path]) -> Path:
         """
@@ -414,10 +577,8 @@ class JobBuilder:
             Path object for the saved file
         """
         filepath = Path(filepath)
-        
-        with open(filepath, 'w') as f:
-            f.write(self.to_yaml())
-        
+        # Written as UTF-8 whatever the locale, matching how files are loaded
+        filepath.write_bytes(self.to_yaml().encode("utf-8"))
         return filepath
     
     def submit(self) -> Job:
@@ -433,47 +594,79 @@ class JobBuilder:
         # Validate before submission
         self.validate()
         
-        # Create temporary YAML file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(self.to_yaml())
-            temp_yaml_path = Path(f.name)
-        
-        try:
-            # Submit job using the client
-            job = self._client.submit_job(temp_yaml_path, **self._execution_params)
-            return job
-        finally:
-            # Clean up temporary file
-            try:
-                temp_yaml_path.unlink()
-            except:
-                pass  # Don't fail if cleanup fails
+        # Hand the configuration over directly instead of through a YAML file
+        return self._client.submit_job_config(self.get_config(), **self._execution_params)
+    
+    def reset(self) -> "JobBuilder":
+        """
+        Discard the configuration and execution parameters.
+        
+        The builder keeps its client and starts again from the default
+        configuration, as if newly created.
+        
+        Returns:
+            Self for chaining
+        """
+        self._config = _new_config()
+        self._execution_params = {}
+        self._transformation_names = set()
+        self._version += 1
+        return self
     
     def clone(self) -> "JobBuilder":
         """
         Create a copy of this job builder.
         
+        The source, transformation and output lists are copied entry by
+        entry, together with each entry's ``config`` dict and dependency
+        list, so adding to the clone or changing those settings never
+        changes this builder. Values nested deeper inside a ``config`` are
+        shared.
+        
         Returns:
             New JobBuilder instance with same configuration
         """
-        new_builder = JobBuilder(self._client)
-        new_builder._config = self._config.copy()
-        new_builder._execution_params = self._execution_params.copy()
+        config = dict(self._config)
+        for key in _ENTRY_SECTIONS:
+            config[key] = [_copy_entry(entry) for entry in config.get(key) or ()]
+        
+        new_builder = JobBuilder.__new__(JobBuilder)
+        new_builder._client = self._client
+        new_builder._config = config
+        new_builder._execution_params = {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in self._execution_params.items()
+        }
+        new_builder._transformation_names = set(self._transformation_names)
+        # Same content, so the exported YAML stays valid for the clone
+        new_builder._version = self._version
+        new_builder._yaml_cache = self._yaml_cache
         return new_builder
     
     def get_config(self) -> Dict[str, Any]:
         """
         Get current job configuration.
         
+        The returned dictionary is new, but the lists and dicts inside it
+        are shared with the builder and should be treated as read-only.
+        
         Returns:
             Dictionary containing current configuration
         """
-        config = self._config.copy()
+        config = self._export_config()
+        return dict(config) if config is self._config else config
+    
+    def _export_config(self) -> Dict[str, Any]:
+        """
+        Get the configuration in file layout, copying only when needed.
         
+        Returns:
+            The builder's own config dict when there are no execution
+            parameters, otherwise a new dict with an ``execution`` section
+        """
         if self._execution_params:
-            config["execution"] = self._execution_params
-        
-        return config
+            return {**self._config, "execution": self._execution_params}
+        return self._config
     
     def __repr__(self) -> str:
         transform_count = len(self._config.get("transformations", []))
@@ -3,13 +3,16 @@ QETL SDK Command Line Interface
 """
 
 import argparse
+import functools
 import sys
 import json
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
-from .client import QETLClient
+# QETLClient is imported on first use: it pulls in YAML and HTTP
+# libraries that `--help` and `--version` never need
+from . import _json
 from .exceptions import QETLError
 from . import __version__
 
@@ -23,15 +26,45 @@ def setup_logging(verbose: bool = False) -> None:
     )
 
 
+def _write_json(data) -> None:
+    """Write data to stdout as indented JSON, encoded with orjson when available."""
+    output = _json.dumps(data, indent=True) + b"\n"
+    
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. redirected in tests)
+        sys.stdout.write(output.decode("utf-8"))
+        return
+    
+    # Flush pending text output so it stays ahead of the raw bytes
+    sys.stdout.flush()
+    buffer.write(output)
+    buffer.flush()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(mode: str, api_key: Optional[str], qetl_home: Optional[str]):
+    """
+    Create a QETL client, reusing it for identical connection options.
+    
+    Hosts calling ``main()`` repeatedly keep one backend (and its job
+    registry and HTTP session) per set of options instead of one per call.
+    """
+    from .client import QETLClient
+    
+    return QETLClient(mode=mode, api_key=api_key, qetl_home=qetl_home)
+
+
+def _create_client(args):
+    """Get the QETL client for the global command line options."""
+    return _get_client(args.mode, args.api_key, args.qetl_home)
+
+
 def cmd_submit(args) -> int:
     """Submit a job from YAML configuration."""
     try:
         # Initialize client
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         # Submit job
         job = client.submit_job(Path(args.yaml_file))
@@ -67,11 +100,7 @@ def cmd_submit(args) -> int:
 def cmd_status(args) -> int:
     """Get job status."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         job = client.get_job(args.job_id)
         status = job.status
@@ -84,7 +113,7 @@ def cmd_status(args) -> int:
         print(f"Updated: {status.updated_at}")
         
         if args.json:
-            print(json.dumps(status.to_dict(), indent=2))
+            _write_json(status.to_dict())
         
         return 0
         
@@ -96,11 +125,7 @@ def cmd_status(args) -> int:
 def cmd_results(args) -> int:
     """Get job results."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         job = client.get_job(args.job_id)
         
@@ -118,7 +143,7 @@ def cmd_results(args) -> int:
             results.save_to_file(args.output_file)
             print(f"Results saved to {args.output_file}")
         else:
-            print(json.dumps(results.to_dict(), indent=2))
+            _write_json(results.to_dict())
         
         return 0
         
@@ -130,27 +155,27 @@ def cmd_results(args) -> int:
 def cmd_list(args) -> int:
     """List jobs."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         jobs = client.list_jobs(status=args.status, limit=args.limit)
         
         if args.json:
-            job_data = []
-            for job in jobs:
-                job_data.append(job.status.to_dict())
-            print(json.dumps(job_data, indent=2))
+            job_data = [job.status.to_dict() for job in jobs]
+            _write_json(job_data)
         else:
-            print(f"{'Job ID':<36} {'Status':<12} {'Progress':<10} {'Created'}")
-            print("-" * 80)
+            # Build the whole table and write it once
+            lines = [
+                f"{'Job ID':<36} {'Status':<12} {'Progress':<10} {'Created'}\n",
+                "-" * 80 + "\n"
+            ]
             
+            format_row = "{:<36} {:<12} {:<10.1f} {}\n".format
             for job in jobs:
                 status = job.status
                 created = status.created_at.strftime("%Y-%m-%d %H:%M") if status.created_at else "N/A"
-                print(f"{job.id:<36} {status.state.value:<12} {status.progress:<10.1f} {created}")
+                lines.append(format_row(job.id, status.state.value, status.progress, created))
+            
+            sys.stdout.write("".join(lines))
         
         return 0
         
@@ -162,11 +187,7 @@ def cmd_list(args) -> int:
 def cmd_cancel(args) -> int:
     """Cancel a job."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         job = client.get_job(args.job_id)
         
@@ -185,11 +206,7 @@ def cmd_cancel(args) -> int:
 def cmd_logs(args) -> int:
     """Get job logs."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         job = client.get_job(args.job_id)
         logs = job.get_logs(follow=args.follow)
@@ -207,11 +224,7 @@ def cmd_logs(args) -> int:
 def cmd_validate(args) -> int:
     """Validate YAML configuration."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         result = client.validate_yaml(Path(args.yaml_file))
         
@@ -233,27 +246,29 @@ def cmd_validate(args) -> int:
 def cmd_components(args) -> int:
     """List available components."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         components = client.list_components()
         
         if args.json:
-            print(json.dumps(components, indent=2))
+            _write_json(components)
         else:
-            print(f"{'Name':<25} {'Type':<15} {'Version':<10} {'Description'}")
-            print("-" * 80)
+            # Build the whole table and write it once
+            lines = [
+                f"{'Name':<25} {'Type':<15} {'Version':<10} {'Description'}\n",
+                "-" * 80 + "\n"
+            ]
             
+            format_row = "{:<25} {:<15} {:<10} {}\n".format
             for component in components:
                 name = component.get("name", "Unknown")
                 comp_type = component.get("type", "Unknown")
                 version = component.get("version", "Unknown")
                 description = component.get("description", "No description")
                 
-                print(f"{name:<25} {comp_type:<15} {version:<10} {description}")
+                lines.append(format_row(name, comp_type, version, description))
+            
+            sys.stdout.write("".join(lines))
         
         return 0
         
@@ -265,16 +280,12 @@ def cmd_components(args) -> int:
 def cmd_info(args) -> int:
     """Get instance information."""
     try:
-        client = QETLClient(
-            mode=args.mode,
-            api_key=args.api_key,
-            qetl_home=args.qetl_home
-        )
+        client = _create_client(args)
         
         info = client.get_instance_info()
         
         if args.json:
-            print(json.dumps(info, indent=2))
+            _write_json(info)
         else:
             print("QETL Instance Information:")
             for key, value in info.items():
@@ -287,6 +298,67 @@ def cmd_info(args) -> int:
         return 1
 
 
+# Subcommand name -> handler
+COMMANDS = {
+    "submit": cmd_submit,
+    "status": cmd_status,
+    "results": cmd_results,
+    "list": cmd_list,
+    "cancel": cmd_cancel,
+    "logs": cmd_logs,
+    "validate": cmd_validate,
+    "components": cmd_components,
+    "info": cmd_info,
+}
+
+# Shared argument specs
+_JOB_ID_ARG = (("job_id",), {"help": "Job ID"})
+_YAML_FILE_ARG = (("yaml_file",), {"help": "Path to YAML configuration file"})
+_JSON_ARG = (("--json",), {"action": "store_true", "help": "Output as JSON"})
+
+# Subcommand definitions: (name, help, [(flags, add_argument options), ...])
+SUBCOMMANDS = (
+    ("submit", "Submit a job", (
+        _YAML_FILE_ARG,
+        (("--wait",), {"action": "store_true", "help": "Wait for job completion"}),
+        (("--timeout",), {"type": int, "default": 3600, "help": "Timeout in seconds"}),
+        (("--show-results",), {"action": "store_true", "help": "Show results when complete"}),
+    )),
+    ("status", "Get job status", (
+        _JOB_ID_ARG,
+        _JSON_ARG,
+    )),
+    ("results", "Get job results", (
+        _JOB_ID_ARG,
+        (("--output-file", "-o"), {"help": "Save results to file"}),
+    )),
+    ("list", "List jobs", (
+        (("--status",), {"help": "Filter by status"}),
+        (("--limit",), {"type": int, "default": 20, "help": "Maximum number of jobs to show"}),
+        _JSON_ARG,
+    )),
+    ("cancel", "Cancel a job", (
+        _JOB_ID_ARG,
+    )),
+    ("logs", "Get job logs", (
+        _JOB_ID_ARG,
+        (("--follow", "-f"), {"action": "store_true", "help": "Follow logs in real-time"}),
+    )),
+    ("validate", "Validate YAML configuration", (
+        _YAML_FILE_ARG,
+    )),
+    ("components", "List available components", (
+        _JSON_ARG,
+    )),
+    ("info", "Get instance information", (
+        _JSON_ARG,
+    )),
+)
+
+# Built on the first main() call and reused by later calls
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -326,66 +398,30 @@ def create_parser() -> argparse.ArgumentParser:
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
     
-    # Submit command
-    submit_parser = subparsers.add_parser("submit", help="Submit a job")
-    submit_parser.add_argument("yaml_file", help="Path to YAML configuration file")
-    submit_parser.add_argument("--wait", action="store_true", help="Wait for job completion")
-    submit_parser.add_argument("--timeout", type=int, default=3600, help="Timeout in seconds")
-    submit_parser.add_argument("--show-results", action="store_true", help="Show results when complete")
-    submit_parser.set_defaults(func=cmd_submit)
-    
-    # Status command
-    status_parser = subparsers.add_parser("status", help="Get job status")
-    status_parser.add_argument("job_id", help="Job ID")
-    status_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    status_parser.set_defaults(func=cmd_status)
-    
-    # Results command
-    results_parser = subparsers.add_parser("results", help="Get job results")
-    results_parser.add_argument("job_id", help="Job ID")
-    results_parser.add_argument("--output-file", "-o", help="Save results to file")
-    results_parser.set_defaults(func=cmd_results)
-    
-    # List command
-    list_parser = subparsers.add_parser("list", help="List jobs")
-    list_parser.add_argument("--status", help="Filter by status")
-    list_parser.add_argument("--limit", type=int, default=20, help="Maximum number of jobs to show")
-    list_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    list_parser.set_defaults(func=cmd_list)
-    
-    # Cancel command
-    cancel_parser = subparsers.add_parser("cancel", help="Cancel a job")
-    cancel_parser.add_argument("job_id", help="Job ID")
-    cancel_parser.set_defaults(func=cmd_cancel)
-    
-    # Logs command
-    logs_parser = subparsers.add_parser("logs", help="Get job logs")
-    logs_parser.add_argument("job_id", help="Job ID")
-    logs_parser.add_argument("--follow", "-f", action="store_true", help="Follow logs in real-time")
-    logs_parser.set_defaults(func=cmd_logs)
-    
-    # Validate command
-    validate_parser = subparsers.add_parser("validate", help="Validate YAML configuration")
-    validate_parser.add_argument("yaml_file", help="Path to YAML configuration file")
-    validate_parser.set_defaults(func=cmd_validate)
-    
-    # Components command
-    components_parser = subparsers.add_parser("components", help="List available components")
-    components_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    components_parser.set_defaults(func=cmd_components)
-    
-    # Info command
-    info_parser = subparsers.add_parser("info", help="Get instance information")
-    info_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    info_parser.set_defaults(func=cmd_info)
+    for name, help_text, arguments in SUBCOMMANDS:
+        subparser = subparsers.add_parser(name, help=help_text)
+        for flags, options in arguments:
+            subparser.add_argument(*flags, **options)
     
     return parser
 
 
-def main() -> int:
-    """Main CLI entry point."""
-    parser = create_parser()
-    args = parser.parse_args()
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Main CLI entry point.
+    
+    Args:
+        argv: Command line arguments (defaults to ``sys.argv[1:]``)
+        
+    Returns:
+        Process exit code
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = create_parser()
+    
+    parser = _PARSER
+    args = parser.parse_args(argv)
     
     # Setup logging
     setup_logging(args.verbose)
@@ -396,7 +432,7 @@ def main() -> int:
         return 1
     
     # Execute command
-    return args.func(args)
+    return COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
@@ -4,15 +4,15 @@ QETL Client - Main client class for interacting with QETL services
 
 import os
 import sys
+import time
 import logging
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Callable, Iterable, Tuple, Union
 from pathlib import Path
 
+from . import _home
 from .job import Job
 from .builder import JobBuilder
 from .exceptions import QETLError, AuthenticationError, ValidationError
-from .local_runner import LocalRunner
-from .cloud_client import CloudClient
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +26,11 @@ class QETLClient:
     - Cloud mode: Submits jobs to QETL Enterprise Cloud
     """
     
+    # Seconds to reuse backend metadata before asking the backend again.
+    # The component catalog is static; instance info carries live job counts.
+    COMPONENTS_CACHE_TTL = 300.0
+    INSTANCE_INFO_CACHE_TTL = 5.0
+    
     def __init__(
         self,
         mode: str = "local",
@@ -54,9 +59,13 @@ class QETLClient:
         self.base_url = base_url
         self.timeout = timeout
         self.qetl_home = qetl_home or self._detect_qetl_home()
+        self._cache: Dict[str, Tuple[float, Any]] = {}
         
-        # Initialize appropriate backend
+        # Initialize appropriate backend; each is imported on demand so local
+        # mode never loads requests/urllib3
         if self.mode == "local":
+            from .local_runner import LocalRunner
+            
             self._backend = LocalRunner(
                 qetl_home=self.qetl_home,
                 timeout=timeout,
@@ -67,6 +76,9 @@ class QETLClient:
                 raise AuthenticationError("API key is required for cloud mode")
             if not instance_id:
                 raise AuthenticationError("Instance ID is required for cloud mode")
+            
+            from .cloud_client import CloudClient
+            
             self._backend = CloudClient(
                 instance_id=instance_id,
                 api_key=api_key,
@@ -77,7 +89,7 @@ class QETLClient:
         else:
             raise ValueError(f"Unsupported mode: {mode}. Use 'local' or 'cloud'")
             
-        logger.info(f"QETL client initialized in {self.mode} mode")
+        logger.info("QETL client initialized in %s mode", self.mode)
     
     def _detect_qetl_home(self) -> Optional[str]:
         """
@@ -86,20 +98,29 @@ class QETLClient:
         Returns:
             Path to QETL installation or None if not found
         """
-        # Check environment variable
-        if "QETL_HOME" in os.environ:
-            return os.environ["QETL_HOME"]
+        return _home.find_qetl_home()
+    
+    def _cached(self, key: str, ttl: float, fetch: Callable[[], Any], refresh: bool = False) -> Any:
+        """
+        Return a cached backend result, fetching it again once it expires.
         
-        # Check current directory and parent directories
-        current_dir = Path.cwd()
-        for path in [current_dir] + list(current_dir.parents):
-            # Look for QETL pipeline indicators
-            if (path / "core" / "quantum_mathematics_engine.py").exists():
-                return str(path)
-            if (path / "yaml_pipeline_runner").exists():
-                return str(path)
+        Args:
+            key: Cache entry name
+            ttl: Seconds the cached value stays valid
+            fetch: Callable returning a fresh value
+            refresh: Bypass the cache and fetch a fresh value
+            
+        Returns:
+            Cached or freshly fetched value
+        """
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and not refresh and now - entry[0] < ttl:
+            return entry[1]
         
-        return None
+        value = fetch()
+        self._cache[key] = (now, value)
+        return value
     
     def submit_job(
         self, 
@@ -120,18 +141,91 @@ class QETLClient:
             ValidationError: If YAML configuration is invalid
             QETLError: If job submission fails
         """
-        yaml_path = Path(yaml_file)
-        if not yaml_path.exists():
+        if not os.path.isfile(yaml_file):
             raise QETLError(f"YAML file not found: {yaml_file}")
         
-        logger.info(f"Submitting job from {yaml_file}")
+        logger.info("Submitting job from %s", yaml_file)
+        
+        try:
+            return self._backend.submit_job(Path(yaml_file), **kwargs)
+        except Exception as e:
+            logger.error("Failed to submit job: %s", e)
+            raise QETLError(f"Job submission failed: {e}") from e
+    
+    def submit_job_config(self, config: Dict[str, Any], **kwargs) -> Job:
+        """
+        Submit a job from an in-memory configuration dictionary.
+        
+        Unlike ``submit_job`` there is no YAML file to write or parse on the
+        client side; the backend receives the dictionary directly.
+        
+        Args:
+            config: Job configuration dictionary (same layout as the YAML file)
+            **kwargs: Additional job parameters (priority, timeout, etc.)
+            
+        Returns:
+            Job object for monitoring and result retrieval
+            
+        Raises:
+            QETLError: If job submission fails
+        """
+        logger.info("Submitting job for pipeline %r", config.get('pipeline_name'))
         
         try:
-            return self._backend.submit_job(yaml_path, **kwargs)
+            return self._backend.submit_job_config(config, **kwargs)
         except Exception as e:
-            logger.error(f"Failed to submit job: {e}")
+            logger.error("Failed to submit job: %s", e)
             raise QETLError(f"Job submission failed: {e}") from e
     
+    def submit_jobs(
+        self,
+        yaml_files: Iterable[Union[str, Path]],
+        continue_on_failure: bool = True,
+        **kwargs
+    ) -> List[Job]:
+        """
+        Submit a batch of jobs from YAML configuration files.
+        
+        All files are checked for existence before anything is submitted,
+        so a missing file never leaves a partially submitted batch.
+        
+        Args:
+            yaml_files: Paths to YAML configuration files
+            continue_on_failure: If True, log failed submissions and keep
+                going; if False, stop at the first failed submission
+            **kwargs: Additional job parameters applied to every job
+            
+        Returns:
+            List of Job objects in submission order (failed submissions
+            are omitted)
+            
+        Raises:
+            QETLError: If a file is missing, or a submission fails and
+                continue_on_failure is False. In the latter case the jobs
+                submitted before the failure are in ``details["submitted"]``
+                so they can still be tracked or cancelled.
+        """
+        yaml_paths = [Path(yaml_file) for yaml_file in yaml_files]
+        missing = [str(path) for path in yaml_paths if not os.path.isfile(path)]
+        if missing:
+            raise QETLError(f"YAML file not found: {', '.join(missing)}")
+        
+        logger.info("Submitting batch of %d jobs", len(yaml_paths))
+        
+        jobs = []
+        for yaml_path in yaml_paths:
+            try:
+                jobs.append(self._backend.submit_job(yaml_path, **kwargs))
+            except Exception as e:
+                logger.error("Failed to submit job from %s: %s", yaml_path, e)
+                if not continue_on_failure:
+                    raise QETLError(
+                        f"Job submission failed for {yaml_path}: {e}",
+                        details={"submitted": jobs}
+                    ) from e
+        
+        return jobs
+    
     def create_job(self) -> JobBuilder:
         """
         Create a job programmatically using the builder pattern.
@@ -161,7 +255,7 @@ class QETLClient:
         try:
             return self._backend.list_jobs(status=status, limit=limit, **kwargs)
         except Exception as e:
-            logger.error(f"Failed to list jobs: {e}")
+            logger.error("Failed to list jobs: %s", e)
             raise QETLError(f"Failed to list jobs: {e}") from e
     
     def get_job(self, job_id: str) -> Job:
@@ -180,20 +274,29 @@ class QETLClient:
         try:
             return self._backend.get_job(job_id)
         except Exception as e:
-            logger.error(f"Failed to get job {job_id}: {e}")
+            logger.error("Failed to get job %s: %s", job_id, e)
             raise QETLError(f"Failed to get job {job_id}: {e}") from e
     
-    def list_components(self) -> List[Dict[str, Any]]:
+    def list_components(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         List available processing components.
         
+        The catalog is cached per client for ``COMPONENTS_CACHE_TTL`` seconds.
+        
+        Args:
+            refresh: Bypass the cache and query the backend
+            
         Returns:
             List of component information dictionaries
         """
         try:
-            return self._backend.list_components()
+            components = self._cached(
+                "components", self.COMPONENTS_CACHE_TTL,
+                self._backend.list_components, refresh
+            )
+            return list(components)
         except Exception as e:
-            logger.error(f"Failed to list components: {e}")
+            logger.error("Failed to list components: %s", e)
             raise QETLError(f"Failed to list components: {e}") from e
     
     def validate_yaml(self, yaml_file: Union[str, Path]) -> Dict[str, Any]:
@@ -209,33 +312,58 @@ class QETLClient:
         Raises:
             ValidationError: If YAML is invalid
         """
-        yaml_path = Path(yaml_file)
-        if not yaml_path.exists():
+        if not os.path.isfile(yaml_file):
             raise FileNotFoundError(f"YAML file not found: {yaml_file}")
         
         try:
-            return self._backend.validate_yaml(yaml_path)
+            return self._backend.validate_yaml(Path(yaml_file))
         except Exception as e:
-            logger.error(f"YAML validation failed: {e}")
+            logger.error("YAML validation failed: %s", e)
             raise ValidationError(f"YAML validation failed: {e}") from e
     
-    def get_instance_info(self) -> Dict[str, Any]:
+    def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate an in-memory job configuration without writing or parsing YAML.
+        
+        Args:
+            config: Job configuration dictionary (same layout as the YAML file)
+            
+        Returns:
+            Validation result dictionary
+            
+        Raises:
+            ValidationError: If the configuration is invalid
+        """
+        try:
+            return self._backend.validate_config(config)
+        except Exception as e:
+            logger.error("Configuration validation failed: %s", e)
+            raise ValidationError(f"Configuration validation failed: {e}") from e
+    
+    def get_instance_info(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Get information about the QETL instance.
         
+        The result is cached per client for ``INSTANCE_INFO_CACHE_TTL`` seconds.
+        
+        Args:
+            refresh: Bypass the cache and query the backend
+            
         Returns:
             Dictionary containing instance information
         """
         try:
-            return self._backend.get_instance_info()
+            info = self._cached(
+                "instance_info", self.INSTANCE_INFO_CACHE_TTL,
+                self._backend.get_instance_info, refresh
+            )
+            return dict(info)
         except Exception as e:
-            logger.error(f"Failed to get instance info: {e}")
+            logger.error("Failed to get instance info: %s", e)
             raise QETLError(f"Failed to get instance info: {e}") from e
     
-    def create_job_builder(self) -> "JobBuilder":
-        """Create a new job builder."""
-        from .builder import JobBuilder
-        return JobBuilder(client=self)
+    # Older name for create_job, kept for compatibility
+    create_job_builder = create_job
     
     def __enter__(self):
         """Context manager entry."""
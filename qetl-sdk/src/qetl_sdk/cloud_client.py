@@ -3,12 +3,15 @@ Cloud Client - Backend for cloud-based QETL job execution
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
 from pathlib import Path
 from datetime import datetime, timezone
 
+from . import _json, _yaml
 from .job import Job, JobStatus, JobResults, JobState
 from .exceptions import (
     QETLError, AuthenticationError, AuthorizationError, 
@@ -17,6 +20,85 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+try:
+    from ciso8601 import parse_datetime as _parse_dt
+except ImportError:  # Optional speedup, see the "speedups" extra
+    def _parse_dt(value: str) -> datetime:
+        # fromisoformat() only accepts a trailing "Z" from Python 3.11 on
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[int]:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    Returns:
+        Seconds to wait, or None if the header is missing or uses the
+        HTTP-date form
+    """
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _raise_authentication_error(response: requests.Response) -> None:
+    raise AuthenticationError("Authentication failed")
+
+
+def _raise_authorization_error(response: requests.Response) -> None:
+    raise AuthorizationError("Authorization failed")
+
+
+def _raise_rate_limit_error(response: requests.Response) -> None:
+    raise RateLimitError(
+        "Rate limit exceeded",
+        retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+    )
+
+
+# Error statuses with a dedicated exception; any other status >= 400 is
+# reported as a NetworkError
+_STATUS_HANDLERS = {
+    401: _raise_authentication_error,
+    403: _raise_authorization_error,
+    429: _raise_rate_limit_error,
+}
+
+
+class _APISession(requests.Session):
+    """
+    Session with a default timeout and per-host environment settings.
+    
+    ``requests`` re-reads proxy and CA bundle settings from the environment
+    on every request; for a client talking to one API host they never
+    change, so the merged settings are cached per host.
+    """
+    
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+        self._env_settings: Dict[Tuple, Dict[str, Any]] = {}
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+    
+    def merge_environment_settings(self, url, proxies, stream, verify, cert):
+        # Explicit per-request proxies are rare; don't cache those
+        if proxies:
+            return super().merge_environment_settings(url, proxies, stream, verify, cert)
+        
+        scheme, netloc = urlsplit(url)[:2]
+        key = (scheme, netloc, stream, verify, cert)
+        settings = self._env_settings.get(key)
+        if settings is None:
+            settings = super().merge_environment_settings(url, proxies, stream, verify, cert)
+            self._env_settings[key] = settings
+        return dict(settings)
+
 
 class CloudClient:
     """
@@ -26,17 +108,35 @@ class CloudClient:
     Currently serves as a placeholder/stub for future implementation.
     """
     
+    # Connections kept open to the API host, shared by concurrent callers
+    POOL_MAXSIZE = 32
+    # Retries for transient gateway errors; urllib3 only retries idempotent
+    # methods by default, so POST /jobs is never submitted twice
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = (502, 503, 504)
+    
+    # Bytes of an error response body included in NetworkError messages
+    ERROR_BODY_LIMIT = 512
+    
+    DEFAULT_BASE_URL = "https://api.qetl.io/v1"
+    # Fixed endpoints whose full URLs are built once per client
+    STATIC_ENDPOINTS = (
+        "/auth/validate", "/jobs", "/validate", "/components", "/instance/info"
+    )
+    
     def __init__(
         self,
         api_key: str,
-        base_url: str = "https://api.qetl.io/v1",
+        base_url: Optional[str] = None,
         timeout: int = 30,
         **kwargs
     ):
         self.api_key = api_key
-        self.base_url = base_url.rstrip('/')
+        self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip('/')
         self.timeout = timeout
-        self._session = requests.Session()
+        self._urls = {endpoint: self.base_url + endpoint for endpoint in self.STATIC_ENDPOINTS}
+        self._session = self._create_session()
         
         # Set up authentication headers
         self._session.headers.update({
@@ -45,20 +145,49 @@ class CloudClient:
             "User-Agent": "qetl-sdk/1.0.0"
         })
         
-        # Validate authentication
-        self._validate_authentication()
+        # The API key is checked by the first request (any 401 raises
+        # AuthenticationError); call connect() to check it up front
+        self._auth_validated = False
         
-        logger.info(f"Cloud client initialized for {base_url}")
+        logger.info("Cloud client initialized for %s", self.base_url)
     
-    def _validate_authentication(self) -> None:
-        """Validate API key by making a test request."""
-        try:
-            response = self._make_request("GET", "/auth/validate")
-            if response.status_code != 200:
-                raise AuthenticationError("Invalid API key")
-        except requests.exceptions.RequestException as e:
-            # For now, just log the error since cloud API isn't available
-            logger.warning(f"Could not validate API key - cloud API not available: {e}")
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with connection pooling and retries."""
+        session = _APISession(timeout=self.timeout)
+        
+        retries = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.POOL_MAXSIZE, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        return session
+    
+    def cleanup(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+    
+    def connect(self) -> None:
+        """
+        Validate the API key with a test request.
+        
+        Optional: construction makes no network calls, and the first API
+        request fails with AuthenticationError if the key is rejected.
+        
+        Raises:
+            AuthenticationError: If the API key is invalid
+            NetworkError: If the cloud API cannot be reached
+        """
+        if self._auth_validated:
+            return
+        
+        response = self._make_request("GET", "/auth/validate")
+        if response.status_code != 200:
+            raise AuthenticationError("Invalid API key")
     
     def _make_request(
         self,
@@ -84,33 +213,32 @@ class CloudClient:
             AuthenticationError: If authentication fails
             RateLimitError: If rate limited
         """
-        url = f"{self.base_url}{endpoint}"
+        url = self._urls.get(endpoint) or self.base_url + endpoint
+        
+        # Encode the body ourselves so orjson is used when installed; the
+        # session already sends Content-Type: application/json
+        body = _json.dumps(data) if data is not None else None
         
         try:
             response = self._session.request(
                 method=method,
                 url=url,
-                json=data,
-                params=params,
-                timeout=self.timeout
+                data=body,
+                params=params
             )
             
-            # Handle common HTTP errors
-            if response.status_code == 401:
-                raise AuthenticationError("Authentication failed")
-            elif response.status_code == 403:
-                raise AuthorizationError("Authorization failed")
-            elif response.status_code == 429:
-                retry_after = response.headers.get("Retry-After")
-                raise RateLimitError(
-                    "Rate limit exceeded",
-                    retry_after=int(retry_after) if retry_after else None
-                )
-            elif response.status_code >= 400:
-                error_msg = f"HTTP {response.status_code}: {response.text}"
-                raise NetworkError(error_msg, status_code=response.status_code)
+            status = response.status_code
+            if status < 400:
+                self._auth_validated = True
+                return response
+            
+            handler = _STATUS_HANDLERS.get(status)
+            if handler is not None:
+                handler(response)
             
-            return response
+            # Only decode the start of the body; error pages can be large
+            body = response.content[:self.ERROR_BODY_LIMIT].decode("utf-8", "replace")
+            raise NetworkError(f"HTTP {status}: {body}", status_code=status)
             
         except requests.exceptions.Timeout:
             raise NetworkError(f"Request timeout after {self.timeout} seconds")
@@ -119,6 +247,29 @@ class CloudClient:
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Request failed: {e}")
     
+    def _parse_response(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON response body.
+        
+        Parses the raw bytes with the shared JSON helper (orjson when
+        installed) instead of ``response.json()``.
+        
+        Args:
+            response: Response returned by ``_make_request``
+            
+        Returns:
+            Parsed JSON document
+            
+        Raises:
+            NetworkError: If the body is not valid JSON
+        """
+        try:
+            return _json.loads(response.content)
+        except ValueError as e:
+            raise NetworkError(
+                f"Invalid JSON response: {e}", status_code=response.status_code
+            )
+    
     def submit_job(self, yaml_path: Path, **kwargs) -> Job:
         """
         Submit a job to the cloud for execution.
@@ -130,9 +281,19 @@ class CloudClient:
         Returns:
             Job object for monitoring
             
+        Raises:
+            ValidationError: If the file is missing or is not valid YAML
+            
         Note:
-            This is a stub implementation. The actual cloud API is not yet available.
+            The YAML is parsed locally and submitted as a JSON configuration
+            through ``submit_job_config``, which is still a stub until the
+            cloud API is available. A bad file is therefore reported before
+            the stub's "not yet available" error.
         """
+        return self.submit_job_config(_yaml.load_config_file_cached(yaml_path), **kwargs)
+    
+    def submit_job_config(self, config: Dict[str, Any], **kwargs) -> Job:
+        """Submit an in-memory job configuration to the cloud as JSON."""
         # For now, raise an error indicating cloud mode is not available
         raise QETLError(
             "Cloud execution is not yet available. "
@@ -140,15 +301,10 @@ class CloudClient:
             "Please use local mode for now."
         )
         
-        # Future implementation would look like:
+        # Future implementation:
         """
-        # Read YAML configuration
-        with open(yaml_path, 'r') as f:
-            yaml_content = f.read()
-        
-        # Prepare job submission data
         job_data = {
-            "yaml_config": yaml_content,
+            "config": config,
             "metadata": {
                 "client_version": "1.0.0",
                 "submission_time": datetime.now(timezone.utc).isoformat()
@@ -156,40 +312,51 @@ class CloudClient:
             **kwargs
         }
         
-        # Submit job
         response = self._make_request("POST", "/jobs", data=job_data)
-        job_info = response.json()
+        job_info = self._parse_response(response)
         
-        # Create job object
         initial_status = JobStatus(
             job_id=job_info["job_id"],
             state=JobState(job_info["status"]),
             progress=job_info.get("progress", 0.0),
             message=job_info.get("message", "Job submitted"),
-            created_at=datetime.fromisoformat(job_info["created_at"])
+            created_at=_parse_dt(job_info["created_at"])
         )
         
         return Job(job_info["job_id"], self, initial_status)
         """
     
-    def get_job_status(self, job_id: str) -> JobStatus:
-        """Get current job status from cloud."""
-        # Stub implementation
-        raise QETLError("Cloud execution is not yet available")
+    def _job_status_from_info(self, job_info: Dict[str, Any]) -> JobStatus:
+        """
+        Build a JobStatus from a job record returned by the API.
         
-        # Future implementation:
+        Args:
+            job_info: Decoded job record
+            
+        Returns:
+            JobStatus for the record
         """
-        response = self._make_request("GET", f"/jobs/{job_id}")
-        job_info = response.json()
+        parse_dt = _parse_dt
+        updated_at = job_info.get("updated_at")
         
         return JobStatus(
-            job_id=job_id,
+            job_id=job_info["job_id"],
             state=JobState(job_info["status"]),
             progress=job_info.get("progress", 0.0),
             message=job_info.get("message", ""),
-            created_at=datetime.fromisoformat(job_info["created_at"]),
-            updated_at=datetime.fromisoformat(job_info["updated_at"])
+            created_at=parse_dt(job_info["created_at"]),
+            updated_at=parse_dt(updated_at) if updated_at else None
         )
+    
+    def get_job_status(self, job_id: str) -> JobStatus:
+        """Get current job status from cloud."""
+        # Stub implementation
+        raise QETLError("Cloud execution is not yet available")
+        
+        # Future implementation:
+        """
+        response = self._make_request("GET", f"/jobs/{job_id}")
+        return self._job_status_from_info(self._parse_response(response))
         """
     
     def get_job_results(self, job_id: str) -> JobResults:
@@ -200,7 +367,7 @@ class CloudClient:
         # Future implementation:
         """
         response = self._make_request("GET", f"/jobs/{job_id}/results")
-        results_info = response.json()
+        results_info = self._parse_response(response)
         
         return JobResults(
             job_id=job_id,
@@ -219,7 +386,7 @@ class CloudClient:
         # Future implementation:
         """
         response = self._make_request("POST", f"/jobs/{job_id}/cancel")
-        return response.json().get("cancelled", False)
+        return self._parse_response(response).get("cancelled", False)
         """
     
     def list_jobs(
@@ -239,21 +406,13 @@ class CloudClient:
             params["status"] = status
         
         response = self._make_request("GET", "/jobs", params=params)
-        jobs_info = response.json()
-        
-        jobs = []
-        for job_info in jobs_info["jobs"]:
-            job_status = JobStatus(
-                job_id=job_info["job_id"],
-                state=JobState(job_info["status"]),
-                progress=job_info.get("progress", 0.0),
-                message=job_info.get("message", ""),
-                created_at=datetime.fromisoformat(job_info["created_at"]),
-                updated_at=datetime.fromisoformat(job_info["updated_at"])
-            )
-            jobs.append(Job(job_info["job_id"], self, job_status))
+        jobs_info = self._parse_response(response)["jobs"]
         
-        return jobs
+        status_from_info = self._job_status_from_info
+        return [
+            Job(job_info["job_id"], self, status_from_info(job_info))
+            for job_info in jobs_info
+        ]
         """
     
     def get_job(self, job_id: str) -> Job:
@@ -276,7 +435,7 @@ class CloudClient:
         """
         params = {"follow": follow} if follow else None
         response = self._make_request("GET", f"/jobs/{job_id}/logs", params=params)
-        logs_info = response.json()
+        logs_info = self._parse_response(response)
         
         return logs_info.get("logs", [])
         """
@@ -289,28 +448,30 @@ class CloudClient:
         # Future implementation:
         """
         response = self._make_request("GET", "/components")
-        components_info = response.json()
+        components_info = self._parse_response(response)
         
         return components_info.get("components", [])
         """
     
     def validate_yaml(self, yaml_path: Path) -> Dict[str, Any]:
         """Validate YAML configuration against cloud schema."""
+        # Parse locally (libyaml when available) so syntax errors never reach
+        # the API; the schema check itself is done by validate_config
+        return self.validate_config(_yaml.load_config_file(yaml_path))
+    
+    def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate an in-memory configuration against cloud schema."""
         # Stub implementation
         raise QETLError("Cloud execution is not yet available")
         
         # Future implementation:
         """
-        with open(yaml_path, 'r') as f:
-            yaml_content = f.read()
-        
-        data = {"yaml_config": yaml_content}
-        response = self._make_request("POST", "/validate", data=data)
-        validation_info = response.json()
+        response = self._make_request("POST", "/validate", data={"config": config})
+        validation_info = self._parse_response(response)
         
         if not validation_info["valid"]:
             raise ValidationError(
-                "YAML validation failed",
+                "Configuration validation failed",
                 validation_errors=validation_info.get("errors", [])
             )
         
@@ -330,5 +491,5 @@ class CloudClient:
         # Future implementation:
         """
         response = self._make_request("GET", "/instance/info")
-        return response.json()
+        return self._parse_response(response)
         """
@@ -4,15 +4,23 @@ QETL SDK Exceptions
 Custom exceptions for the QETL SDK.
 """
 
+from typing import Optional
+
 
 class QETLError(Exception):
     """Base exception for all QETL SDK errors."""
     
+    # Subclasses set their code here so constructing one stays a plain
+    # attribute lookup; pass error_code to override it per instance.
+    error_code: Optional[str] = None
+    
     def __init__(self, message: str, error_code: str = None, details: dict = None):
         super().__init__(message)
         self.message = message
-        self.error_code = error_code
-        self.details = details or {}
+        if error_code is not None:
+            self.error_code = error_code
+        # Each error gets its own dict so callers can add to and serialize it
+        self.details = details if details is not None else {}
     
     def __str__(self) -> str:
         if self.error_code:
@@ -23,85 +31,107 @@ class QETLError(Exception):
 class AuthenticationError(QETLError):
     """Raised when authentication fails."""
     
+    error_code = "AUTH_ERROR"
+    
     def __init__(self, message: str = "Authentication failed"):
-        super().__init__(message, error_code="AUTH_ERROR")
+        super().__init__(message)
 
 
 class AuthorizationError(QETLError):
     """Raised when authorization fails."""
     
+    error_code = "AUTHZ_ERROR"
+    
     def __init__(self, message: str = "Authorization failed"):
-        super().__init__(message, error_code="AUTHZ_ERROR")
+        super().__init__(message)
 
 
 class ValidationError(QETLError):
     """Raised when input validation fails."""
     
+    error_code = "VALIDATION_ERROR"
+    
     def __init__(self, message: str, validation_errors: list = None):
-        super().__init__(message, error_code="VALIDATION_ERROR")
+        super().__init__(message)
         self.validation_errors = validation_errors or []
 
 
 class JobExecutionError(QETLError):
     """Raised when job execution fails."""
     
+    error_code = "JOB_EXECUTION_ERROR"
+    
     def __init__(self, message: str, job_id: str = None):
-        super().__init__(message, error_code="JOB_EXECUTION_ERROR")
+        super().__init__(message)
         self.job_id = job_id
 
 
 class TimeoutError(QETLError):
     """Raised when operations timeout."""
     
+    error_code = "TIMEOUT_ERROR"
+    
     def __init__(self, message: str = "Operation timed out", timeout_seconds: int = None):
-        super().__init__(message, error_code="TIMEOUT_ERROR")
+        super().__init__(message)
         self.timeout_seconds = timeout_seconds
 
 
 class ConfigurationError(QETLError):
     """Raised when configuration is invalid."""
     
+    error_code = "CONFIG_ERROR"
+    
     def __init__(self, message: str):
-        super().__init__(message, error_code="CONFIG_ERROR")
+        super().__init__(message)
 
 
 class ComponentNotFoundError(QETLError):
     """Raised when a requested component is not found."""
     
+    error_code = "COMPONENT_NOT_FOUND"
+    
     def __init__(self, component_name: str):
         message = f"Component not found: {component_name}"
-        super().__init__(message, error_code="COMPONENT_NOT_FOUND")
+        super().__init__(message)
         self.component_name = component_name
 
 
 class JobNotFoundError(QETLError):
     """Raised when a requested job is not found."""
     
+    error_code = "JOB_NOT_FOUND"
+    
     def __init__(self, job_id: str):
         message = f"Job not found: {job_id}"
-        super().__init__(message, error_code="JOB_NOT_FOUND")
+        super().__init__(message)
         self.job_id = job_id
 
 
 class NetworkError(QETLError):
     """Raised when network operations fail."""
     
+    error_code = "NETWORK_ERROR"
+    
     def __init__(self, message: str, status_code: int = None):
-        super().__init__(message, error_code="NETWORK_ERROR")
+        super().__init__(message)
         self.status_code = status_code
 
 
 class RateLimitError(QETLError):
     """Raised when rate limits are exceeded."""
     
+    error_code = "RATE_LIMIT_ERROR"
+    
     def __init__(self, message: str = "Rate limit exceeded", retry_after: int = None):
-        super().__init__(message, error_code="RATE_LIMIT_ERROR")
+        super().__init__(message)
         self.retry_after = retry_after
 
 
 class QuotaExceededError(QETLError):
     """Raised when usage quotas are exceeded."""
     
+    error_code = "QUOTA_EXCEEDED"
+    
     def __init__(self, message: str = "Quota exceeded", quota_type: str = None):
-        super().__init__(message, error_code="QUOTA_EXCEEDED")
+        super().__init__(message)
         self.quota_type = quota_type
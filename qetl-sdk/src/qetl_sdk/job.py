@@ -3,15 +3,22 @@ QETL Job - Job management and status tracking
 """
 
 import time
+import random
+import functools
 import asyncio
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Optional, Dict, Any, List, Callable, Union
+from typing import Optional, Dict, Any, List, AsyncIterator, Callable, Iterator, Union
 from datetime import datetime, timezone
 from pathlib import Path
-import json
 
+from . import _json
 from .exceptions import QETLError, JobNotFoundError, TimeoutError
 
+logger = logging.getLogger(__name__)
+
 
 class JobState(Enum):
     """Job execution states."""
@@ -24,10 +31,190 @@ class JobState(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    
+    @property
+    def is_terminal(self) -> bool:
+        """Check if this is a terminal state."""
+        return self in TERMINAL_STATES
+
+
+# States a job never leaves once reached
+TERMINAL_STATES = frozenset({JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED})
+
+# States in which a job is actively executing
+RUNNING_STATES = frozenset({JobState.RUNNING, JobState.INITIALIZING, JobState.COMPLETING})
+
+
+# Status polling: start fast so short jobs finish promptly, then back off
+# so long-running jobs don't hammer the backend
+POLL_INITIAL_INTERVAL = 0.1
+POLL_MAX_INTERVAL = 5.0
+POLL_MULTIPLIER = 1.5
+POLL_JITTER = 0.1
+
+
+class _PollBackoff:
+    """
+    Exponential backoff with jitter for status polling.
+    
+    The interval grows while consecutive polls return the same status and
+    drops back to the initial interval whenever the state, progress or
+    message changes.
+    """
+    
+    __slots__ = ("initial", "max_interval", "multiplier", "jitter", "interval", "_last_seen")
+    
+    def __init__(
+        self,
+        initial: float = POLL_INITIAL_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+        multiplier: float = POLL_MULTIPLIER,
+        jitter: float = POLL_JITTER
+    ):
+        self.initial = initial
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.interval = initial
+        self._last_seen = None
+    
+    def next_delay(self, status: "JobStatus") -> float:
+        """Return how long to sleep before polling again after ``status``."""
+        current = (status.state, status.progress, status.message)
+        if current != self._last_seen:
+            self._last_seen = current
+            self.interval = self.initial
+        else:
+            self.interval = min(self.max_interval, self.interval * self.multiplier)
+        
+        if self.jitter:
+            return self.interval + random.uniform(0, self.jitter)
+        return self.interval
+
+
+def _poll_until_terminal(
+    get_status: Callable[[], "JobStatus"],
+    initial: float = POLL_INITIAL_INTERVAL,
+    max_interval: float = POLL_MAX_INTERVAL,
+    multiplier: float = POLL_MULTIPLIER,
+    jitter: float = POLL_JITTER,
+    timeout: Optional[float] = None,
+    job_id: Optional[str] = None
+) -> "JobStatus":
+    """
+    Poll ``get_status`` with exponential backoff until a terminal status.
+    
+    Args:
+        get_status: Callable returning a fresh JobStatus
+        initial: First polling interval in seconds
+        max_interval: Upper bound for the polling interval
+        multiplier: Growth factor while the status is unchanged
+        jitter: Maximum random seconds added to each interval
+        timeout: Maximum time to wait in seconds
+        job_id: Job ID used in the timeout message
+        
+    Returns:
+        Terminal job status
+        
+    Raises:
+        TimeoutError: If timeout is exceeded
+    """
+    backoff = _PollBackoff(initial, max_interval, multiplier, jitter)
+    deadline = time.monotonic() + timeout if timeout else None
+    
+    status = get_status()
+    while not status.is_terminal:
+        delay = backoff.next_delay(status)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Job {job_id} timed out after {timeout} seconds")
+            delay = min(delay, remaining)
+        
+        time.sleep(delay)
+        status = get_status()
+    
+    return status
+
+
+async def _poll_until_terminal_async(
+    get_status: Callable[[], "JobStatus"],
+    initial: float = POLL_INITIAL_INTERVAL,
+    max_interval: float = POLL_MAX_INTERVAL,
+    multiplier: float = POLL_MULTIPLIER,
+    jitter: float = POLL_JITTER,
+    timeout: Optional[float] = None,
+    job_id: Optional[str] = None
+) -> "JobStatus":
+    """Async version of ``_poll_until_terminal``."""
+    backoff = _PollBackoff(initial, max_interval, multiplier, jitter)
+    deadline = time.monotonic() + timeout if timeout else None
+    
+    status = get_status()
+    while not status.is_terminal:
+        delay = backoff.next_delay(status)
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Job {job_id} timed out after {timeout} seconds")
+            delay = min(delay, remaining)
+        
+        await asyncio.sleep(delay)
+        status = get_status()
+    
+    return status
+
+
+# Completion callbacks run here rather than in the thread that noticed the
+# job finish, so a slow callback can't hold up status polling or a worker
+_CALLBACK_WORKERS = 2
+_callback_executor: Optional[ThreadPoolExecutor] = None
+_callback_executor_lock = threading.Lock()
+
+
+def _get_callback_executor() -> ThreadPoolExecutor:
+    """Return the shared completion callback executor, creating it on first use."""
+    global _callback_executor
+    if _callback_executor is None:
+        with _callback_executor_lock:
+            if _callback_executor is None:
+                _callback_executor = ThreadPoolExecutor(
+                    max_workers=_CALLBACK_WORKERS, thread_name_prefix="qetl-cb"
+                )
+    return _callback_executor
+
+
+def _safe_call(callback: Callable, job_id: str, *args) -> None:
+    """Run a callback, logging instead of raising if it fails."""
+    try:
+        callback(*args)
+    except Exception as e:
+        logger.warning("Completion callback for job %s failed: %s", job_id, e)
+
+
+def _utcnow() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _resolve_future(future: "asyncio.Future") -> None:
+    """Mark a waiter future as done unless it was cancelled or timed out."""
+    if not future.done():
+        future.set_result(None)
 
 
 class JobStatus:
-    """Job status information."""
+    """
+    Job status information.
+    
+    Statuses are immutable snapshots: backends share one instance between
+    readers until the job changes, and ``to_dict()`` is computed once.
+    """
+    
+    __slots__ = (
+        "job_id", "state", "progress", "message",
+        "created_at", "updated_at", "metadata", "_dict",
+    )
     
     def __init__(
         self,
@@ -39,23 +226,44 @@ class JobStatus:
         updated_at: Optional[datetime] = None,
         **kwargs
     ):
-        self.job_id = job_id
-        self.state = state
-        self.progress = progress
-        self.message = message
-        self.created_at = created_at or datetime.now(timezone.utc)
-        self.updated_at = updated_at or datetime.now(timezone.utc)
-        self.metadata = kwargs
+        if created_at is None or updated_at is None:
+            now = _utcnow()
+            created_at = created_at or now
+            updated_at = updated_at or now
+        
+        set_attr = object.__setattr__
+        set_attr(self, "job_id", job_id)
+        set_attr(self, "state", state)
+        set_attr(self, "progress", progress)
+        set_attr(self, "message", message)
+        set_attr(self, "created_at", created_at)
+        set_attr(self, "updated_at", updated_at)
+        set_attr(self, "metadata", kwargs)
+        set_attr(self, "_dict", None)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"JobStatus is immutable; cannot set {name!r}")
+    
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"JobStatus is immutable; cannot delete {name!r}")
+    
+    def __reduce__(self):
+        # Rebuild through __init__ so copy and pickle work without setattr
+        return (
+            functools.partial(JobStatus, **self.metadata),
+            (self.job_id, self.state, self.progress, self.message,
+             self.created_at, self.updated_at)
+        )
     
     @property
     def is_terminal(self) -> bool:
         """Check if job is in a terminal state."""
-        return self.state in {JobState.COMPLETED, JobState.FAILED, JobState.CANCELLED}
+        return self.state in TERMINAL_STATES
     
     @property
     def is_running(self) -> bool:
         """Check if job is currently running."""
-        return self.state in {JobState.RUNNING, JobState.INITIALIZING, JobState.COMPLETING}
+        return self.state in RUNNING_STATES
     
     @property
     def is_successful(self) -> bool:
@@ -64,15 +272,21 @@ class JobStatus:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert status to dictionary."""
-        return {
-            "job_id": self.job_id,
-            "state": self.state.value,
-            "progress": self.progress,
-            "message": self.message,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            **self.metadata
-        }
+        data = self._dict
+        if data is None:
+            data = {
+                "job_id": self.job_id,
+                "state": self.state.value,
+                "progress": self.progress,
+                "message": self.message,
+                "created_at": self.created_at.isoformat() if self.created_at else None,
+                "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+                **self.metadata
+            }
+            object.__setattr__(self, "_dict", data)
+        
+        # Callers get their own copy of the memoized dict
+        return dict(data)
     
     def __repr__(self) -> str:
         return f"JobStatus(job_id='{self.job_id}', state='{self.state.value}', progress={self.progress})"
@@ -81,6 +295,8 @@ class JobStatus:
 class JobResults:
     """Job execution results."""
     
+    __slots__ = ("job_id", "outputs", "execution_time", "logs", "metrics", "metadata")
+    
     def __init__(
         self,
         job_id: str,
@@ -102,19 +318,13 @@ class JobResults:
         return self.outputs.get(name, default)
     
     def save_to_file(self, filepath: Union[str, Path]) -> None:
-        """Save results to JSON file."""
-        filepath = Path(filepath)
-        result_data = {
-            "job_id": self.job_id,
-            "outputs": self.outputs,
-            "execution_time": self.execution_time,
-            "logs": self.logs,
-            "metrics": self.metrics,
-            **self.metadata
-        }
+        """
+        Save results to JSON file.
         
-        with open(filepath, 'w') as f:
-            json.dump(result_data, f, indent=2, default=str)
+        The document is encoded in one pass with the shared JSON helper
+        (orjson when installed) and written as bytes.
+        """
+        Path(filepath).write_bytes(_json.dumps(self.to_dict(), indent=True))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert results to dictionary."""
@@ -137,6 +347,12 @@ class Job:
     Represents a QETL job with status tracking and result retrieval capabilities.
     """
     
+    __slots__ = (
+        "job_id", "_backend", "_status", "_results",
+        "_completion_callbacks", "_status_callbacks", "_completion_fired",
+        "_watching_backend", "_callback_lock",
+    )
+    
     def __init__(
         self,
         job_id: str,
@@ -148,6 +364,11 @@ class Job:
         self._status = initial_status
         self._results: Optional[JobResults] = None
         self._completion_callbacks: List[Callable] = []
+        self._completion_fired = False
+        # Guards the completion callback list and _completion_fired, which
+        # are used from the caller's thread and the backend's worker threads
+        self._callback_lock = threading.Lock()
+        self._watching_backend = False
         self._status_callbacks: List[Callable] = []
     
     @property
@@ -157,13 +378,27 @@ class Job:
     
     @property
     def status(self) -> JobStatus:
-        """Get current job status (cached)."""
+        """
+        Get the last known job status.
+        
+        The backend is only queried if no status has been fetched yet; use
+        ``get_status()`` to refresh.
+        """
         if self._status is None:
             self._status = self.get_status()
         return self._status
     
     def get_status(self) -> JobStatus:
-        """Refresh and return current job status."""
+        """
+        Refresh and return current job status.
+        
+        Terminal states never change, so once one has been seen it is
+        returned without querying the backend again.
+        """
+        status = self._status
+        if status is not None and status.is_terminal:
+            return status
+        
         try:
             self._status = self._backend.get_job_status(self.job_id)
             
@@ -183,10 +418,22 @@ class Job:
         except Exception as e:
             raise QETLError(f"Failed to get job status: {e}") from e
     
-    def get_results(self) -> JobResults:
+    def get_results(
+        self,
+        poll_interval: float = POLL_INITIAL_INTERVAL,
+        max_poll_interval: float = POLL_MAX_INTERVAL
+    ) -> JobResults:
         """
         Get job results. Blocks until job is complete.
         
+        The job is polled with exponential backoff, starting at
+        ``poll_interval`` and growing up to ``max_poll_interval`` while
+        its status is unchanged.
+        
+        Args:
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Maximum seconds between status checks
+            
         Returns:
             JobResults object containing outputs and metadata
             
@@ -195,11 +442,10 @@ class Job:
             QETLError: If results retrieval fails
         """
         # Wait for completion
-        while not self.status.is_terminal:
-            time.sleep(1)
+        status = self._wait_terminal(None, poll_interval, max_poll_interval)
         
-        if not self.status.is_successful:
-            raise QETLError(f"Job {self.job_id} failed: {self.status.message}")
+        if not status.is_successful:
+            raise QETLError(f"Job {self.job_id} failed: {status.message}")
         
         if self._results is None:
             try:
@@ -209,12 +455,19 @@ class Job:
         
         return self._results
     
-    async def get_results_when_done(self, timeout: Optional[int] = None) -> JobResults:
+    async def get_results_when_done(
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: float = POLL_INITIAL_INTERVAL,
+        max_poll_interval: float = POLL_MAX_INTERVAL
+    ) -> JobResults:
         """
         Async version of get_results with optional timeout.
         
         Args:
             timeout: Maximum time to wait in seconds
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Maximum seconds between status checks
             
         Returns:
             JobResults object
@@ -223,17 +476,10 @@ class Job:
             TimeoutError: If timeout is exceeded
             JobExecutionError: If job failed
         """
-        start_time = time.time()
-        
-        while not self.status.is_terminal:
-            if timeout and (time.time() - start_time) > timeout:
-                raise TimeoutError(f"Job {self.job_id} timed out after {timeout} seconds")
-            
-            await asyncio.sleep(1)
-            self.get_status()  # Refresh status
+        status = await self._wait_terminal_async(timeout, poll_interval, max_poll_interval)
         
-        if not self.status.is_successful:
-            raise QETLError(f"Job {self.job_id} failed: {self.status.message}")
+        if not status.is_successful:
+            raise QETLError(f"Job {self.job_id} failed: {status.message}")
         
         if self._results is None:
             try:
@@ -243,6 +489,46 @@ class Job:
         
         return self._results
     
+    async def watch(
+        self,
+        interval: float = 1.0,
+        timeout: Optional[int] = None
+    ) -> AsyncIterator[JobStatus]:
+        """
+        Asynchronously yield status updates until the job reaches a terminal state.
+        
+        A status is yielded whenever its state, progress or message changes;
+        the final terminal status is always yielded before the iterator ends.
+        
+        Args:
+            interval: Seconds to wait between status checks
+            timeout: Maximum time to wait in seconds
+            
+        Yields:
+            JobStatus objects as the job progresses
+            
+        Raises:
+            TimeoutError: If timeout is exceeded
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        last_seen = None
+        
+        while True:
+            status = self.get_status()
+            
+            current = (status.state, status.progress, status.message)
+            if current != last_seen:
+                last_seen = current
+                yield status
+            
+            if status.is_terminal:
+                return
+            
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Job {self.job_id} timed out after {timeout} seconds")
+            
+            await asyncio.sleep(interval)
+    
     def cancel(self) -> bool:
         """
         Cancel the job if it's still running.
@@ -257,7 +543,7 @@ class Job:
         except Exception as e:
             raise QETLError(f"Failed to cancel job: {e}") from e
     
-    def get_logs(self, follow: bool = False) -> List[str]:
+    def get_logs(self, follow: bool = False) -> Union[List[str], Iterator[str]]:
         """
         Get job execution logs.
         
@@ -265,7 +551,8 @@ class Job:
             follow: If True, stream logs in real-time
             
         Returns:
-            List of log messages
+            List of log messages, or an iterator yielding them as they are
+            produced when following
         """
         try:
             return self._backend.get_job_logs(self.job_id, follow=follow)
@@ -276,14 +563,61 @@ class Job:
         """
         Register a callback to be called when the job completes.
         
+        Callbacks run on a small shared thread pool, never in the thread
+        that noticed the job finish. Coroutine functions are scheduled on
+        the event loop that registered them. Backends that can notify
+        waiters (e.g. local mode) fire the callbacks without the job being
+        polled.
+        
         Args:
-            callback: Function to call with JobResults when job completes
+            callback: Function or coroutine function to call with JobResults
+                when job completes
+                
+        Raises:
+            QETLError: If a coroutine function is registered outside a
+                running event loop
         """
-        self._completion_callbacks.append(callback)
+        if asyncio.iscoroutinefunction(callback):
+            callback = self._bind_coroutine_callback(callback)
+        
+        with self._callback_lock:
+            fired = self._completion_fired
+            if not fired:
+                self._completion_callbacks.append(callback)
+        
+        # Results were already fetched when the job finished
+        if fired:
+            self._run_completion_callback(callback)
+            return
         
         # If job is already complete, trigger callback immediately
         if self.status.is_terminal:
             self._trigger_completion_callbacks()
+        else:
+            self._watch_backend_completion()
+    
+    @staticmethod
+    def _bind_coroutine_callback(callback: Callable) -> Callable[[Optional[JobResults]], None]:
+        """Wrap a coroutine function so it is run on the current event loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            raise QETLError("Coroutine callbacks must be registered from a running event loop")
+        
+        def schedule(results: Optional[JobResults]) -> None:
+            asyncio.run_coroutine_threadsafe(callback(results), loop)
+        
+        return schedule
+    
+    def _watch_backend_completion(self) -> None:
+        """Fire completion callbacks when the backend reports the job done."""
+        if self._watching_backend:
+            return
+        
+        add_done_callback = self._done_notifier()
+        if add_done_callback is not None:
+            self._watching_backend = True
+            add_done_callback(self.job_id, self.get_status)
     
     def on_status_change(self, callback: Callable[[JobStatus], None]) -> None:
         """
@@ -294,12 +628,19 @@ class Job:
         """
         self._status_callbacks.append(callback)
     
-    def wait_until_complete(self, timeout: Optional[int] = None) -> JobStatus:
+    def wait_until_complete(
+        self,
+        timeout: Optional[int] = None,
+        poll_interval: float = POLL_INITIAL_INTERVAL,
+        max_poll_interval: float = POLL_MAX_INTERVAL
+    ) -> JobStatus:
         """
         Block until job completes or timeout is reached.
         
         Args:
             timeout: Maximum time to wait in seconds
+            poll_interval: Initial seconds between status checks
+            max_poll_interval: Maximum seconds between status checks
             
         Returns:
             Final job status
@@ -307,45 +648,119 @@ class Job:
         Raises:
             TimeoutError: If timeout is exceeded
         """
-        start_time = time.time()
+        return self._wait_terminal(timeout, poll_interval, max_poll_interval)
+    
+    def _done_notifier(self) -> Optional[Callable[[str, Callable[[], None]], None]]:
+        """
+        Return the backend's ``add_done_callback`` if it can notify waiters.
         
-        while not self.status.is_terminal:
-            if timeout and (time.time() - start_time) > timeout:
-                raise TimeoutError(f"Job {self.job_id} timed out after {timeout} seconds")
-            
-            time.sleep(1)
-            self.get_status()
+        Looked up on the backend's class so that only backends which really
+        implement notification (e.g. LocalRunner) skip polling.
+        """
+        if getattr(type(self._backend), "add_done_callback", None) is None:
+            return None
+        return self._backend.add_done_callback
+    
+    def _wait_terminal(
+        self,
+        timeout: Optional[int],
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> JobStatus:
+        """Block until the job is terminal, waiting on the backend when possible."""
+        status = self._status
+        if status is not None and status.is_terminal:
+            return status
+        
+        add_done_callback = self._done_notifier()
+        if add_done_callback is None:
+            return _poll_until_terminal(
+                self.get_status,
+                initial=poll_interval,
+                max_interval=max_poll_interval,
+                timeout=timeout,
+                job_id=self.job_id
+            )
+        
+        done = threading.Event()
+        add_done_callback(self.job_id, done.set)
+        if not done.wait(timeout or None):
+            raise TimeoutError(f"Job {self.job_id} timed out after {timeout} seconds")
+        return self.get_status()
+    
+    async def _wait_terminal_async(
+        self,
+        timeout: Optional[int],
+        poll_interval: float,
+        max_poll_interval: float
+    ) -> JobStatus:
+        """Async version of ``_wait_terminal``."""
+        status = self._status
+        if status is not None and status.is_terminal:
+            return status
+        
+        add_done_callback = self._done_notifier()
+        if add_done_callback is None:
+            return await _poll_until_terminal_async(
+                self.get_status,
+                initial=poll_interval,
+                max_interval=max_poll_interval,
+                timeout=timeout,
+                job_id=self.job_id
+            )
         
-        return self.status
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        add_done_callback(
+            self.job_id,
+            lambda: loop.call_soon_threadsafe(_resolve_future, done)
+        )
+        try:
+            await asyncio.wait_for(done, timeout or None)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Job {self.job_id} timed out after {timeout} seconds")
+        return self.get_status()
     
     def is_complete(self) -> bool:
         """Check if job is complete (terminal state)."""
-        return self.status.is_terminal
+        return self.get_status().is_terminal
     
     def is_successful(self) -> bool:
         """Check if job completed successfully."""
-        return self.status.is_successful
+        return self.get_status().is_successful
     
     def _trigger_completion_callbacks(self) -> None:
-        """Trigger all completion callbacks."""
-        if not self._completion_callbacks:
-            return
+        """
+        Trigger pending completion callbacks.
         
-        try:
-            results = self.get_results() if self.status.is_successful else None
-            for callback in self._completion_callbacks:
-                try:
-                    callback(results)
-                except Exception as e:
-                    # Don't let callback errors break the job
-                    pass
-        except Exception:
-            # If we can't get results, call callbacks with None
-            for callback in self._completion_callbacks:
-                try:
-                    callback(None)
-                except Exception:
-                    pass
+        Results are fetched once, the first time the callbacks fire; each
+        callback runs once and is then dropped.
+        """
+        with self._callback_lock:
+            if not self._completion_callbacks:
+                return
+            fetch_results = not self._completion_fired
+        
+        # Fetched without holding the lock; callbacks registered meanwhile
+        # are still pending and are picked up below
+        if fetch_results:
+            try:
+                if self.status.is_successful:
+                    self.get_results()
+            except Exception:
+                # If we can't get results, callbacks are called with None
+                pass
+        
+        with self._callback_lock:
+            self._completion_fired = True
+            callbacks, self._completion_callbacks = self._completion_callbacks, []
+        
+        for callback in callbacks:
+            self._run_completion_callback(callback)
+    
+    def _run_completion_callback(self, callback: Callable[[Optional[JobResults]], None]) -> None:
+        """Queue a completion callback with the job's results, if any."""
+        _get_callback_executor().submit(_safe_call, callback, self.job_id, self._results)
     
     def display(self):
         """Display job information in Jupyter notebook (if available)."""
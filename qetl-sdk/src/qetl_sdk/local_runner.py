@@ -3,23 +3,146 @@ Local Runner - Backend for running QETL jobs locally
 """
 
 import os
+import re
+import atexit
 import sys
+import compileall
+import importlib.machinery
 import subprocess
+import tempfile
 import uuid
 import json
 import time
+import random
 import logging
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import yaml
+from typing import List, Dict, Any, Callable, Iterator, Optional, Set, Tuple, Union
 import threading
-from datetime import datetime, timezone
+import itertools
+import weakref
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from .job import Job, JobStatus, JobResults, JobState
+from . import _home, _json, _yaml
+from .job import Job, JobStatus, JobResults, JobState, _utcnow
 from .exceptions import QETLError, ValidationError, JobExecutionError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
+# Top-level fields every job configuration must define
+REQUIRED_CONFIG_FIELDS = ("pipeline_name", "input_sources", "transformations")
+
+# RAM-backed filesystem used for short-lived job configuration files
+SHM_DIR = "/dev/shm"
+
+# Progress reported by the pipeline runner, e.g. "Progress: 45%"
+_PROGRESS_RE = re.compile(r"\bprogress\b\D*?(\d{1,3}(?:\.\d+)?)\s*%", re.IGNORECASE)
+
+# Structured events printed by the pipeline runner, one JSON object per
+# line after this prefix, e.g. 'QETL-EVENT: {"type": "progress", "pct": 57.3}'.
+# Lines without it are treated as plain output and scanned for the
+# runner's text markers, for runners that don't emit events.
+EVENT_PREFIX = "QETL-EVENT:"
+
+# Job progress while the pipeline runs; runner-reported percentages are
+# mapped onto this range
+RUN_PROGRESS_START = 40.0
+RUN_PROGRESS_END = 90.0
+
+# Runners still alive, stopped at interpreter exit by _shutdown_runners
+_live_runners: "weakref.WeakSet[LocalRunner]" = weakref.WeakSet()
+
+
+def _shutdown_runners() -> None:
+    """Stop every live runner, killing pipelines that are still running."""
+    for runner in list(_live_runners):
+        try:
+            runner.cleanup(kill_running=True)
+        except Exception as e:
+            logger.debug("Failed to stop local runner: %s", e)
+
+
+# The worker pool joins its threads at interpreter exit, so running
+# pipelines must be killed before that join rather than waited for.
+if sys.version_info >= (3, 9):
+    # Since 3.9 the join happens in threading's shutdown, before atexit hooks
+    # run. threading._register_atexit is the CPython hook concurrent.futures
+    # itself uses for it, and the only one that runs earlier.
+    threading._register_atexit(_shutdown_runners)
+else:
+    # Before 3.9 the pool joins its workers from an atexit hook registered
+    # when concurrent.futures was imported; atexit hooks run last in, first
+    # out, so this one runs before it.
+    atexit.register(_shutdown_runners)
+
+
+def _default_spool_dir() -> Optional[str]:
+    """
+    Pick the directory for runner-owned configuration files.
+    
+    Returns:
+        ``SHM_DIR`` when it is a writable directory, otherwise None so that
+        ``tempfile`` falls back to the system temporary directory
+    """
+    if os.path.isdir(SHM_DIR) and os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return SHM_DIR
+    return None
+
+
+class _LogBuffer:
+    """
+    Bounded buffer of a job's output lines that readers can follow.
+    
+    The pipeline reader appends lines as they are produced; followers
+    block on a condition until new lines arrive or the buffer is closed
+    when the job finishes.
+    """
+    
+    __slots__ = ("lines", "total", "closed", "_cond")
+    
+    def __init__(self, maxlen: int):
+        self.lines: deque = deque(maxlen=maxlen)
+        self.total = 0  # Lines ever appended, including ones dropped by maxlen
+        self.closed = False
+        self._cond = threading.Condition()
+    
+    def __bool__(self) -> bool:
+        return self.total > 0
+    
+    def append(self, line: str) -> None:
+        """Add a line and wake any followers."""
+        with self._cond:
+            self.lines.append(line)
+            self.total += 1
+            self._cond.notify_all()
+    
+    def close(self) -> None:
+        """Mark the buffer complete so followers stop waiting."""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+    
+    def snapshot(self) -> List[str]:
+        """Return the lines currently kept."""
+        with self._cond:
+            return list(self.lines)
+    
+    def follow(self) -> Iterator[str]:
+        """Yield every kept line, then new lines as they arrive until closed."""
+        seen = 0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self.total > seen or self.closed)
+                # Lines dropped by maxlen before we got to them are skipped
+                unread = min(self.total - seen, len(self.lines))
+                new_lines = list(itertools.islice(self.lines, len(self.lines) - unread, None))
+                seen = self.total
+                finished = self.closed
+            
+            yield from new_lines
+            if finished and not new_lines:
+                return
+
 
 class LocalRunner:
     """
@@ -29,40 +152,116 @@ class LocalRunner:
     jobs locally before cloud infrastructure is available.
     """
     
+    # Packages of the QETL installation byte-compiled by the prewarm thread
+    PREWARM_PACKAGES = ("core", "yaml_pipeline_runner")
+    
+    # Most recent pipeline output lines kept per job
+    LOG_MAX_LINES = 10000
+    
+    # Job records kept in memory; the oldest finished jobs are dropped first
+    MAX_JOBS = 10000
+    
+    # Seconds a finished job is kept before it is purged. Each job's expiry
+    # is spread over an extra TERMINAL_JOB_TTL_JITTER fraction so jobs that
+    # finish together don't all expire in the same sweep.
+    TERMINAL_JOB_TTL = 3600.0
+    TERMINAL_JOB_TTL_JITTER = 0.1
+    
+    # Minimum seconds between sweeps for expired jobs
+    SWEEP_INTERVAL = 60.0
+    
+    # QETL installations already validated in this process
+    _validated_homes: Set[str] = set()
+    
     def __init__(
         self,
         qetl_home: Optional[str] = None,
         timeout: int = 300,
+        prewarm: bool = False,
+        max_jobs: Optional[int] = None,
+        terminal_job_ttl: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
         **kwargs
     ):
         self.qetl_home = Path(qetl_home) if qetl_home else self._find_qetl_home()
         self.timeout = timeout
-        self.jobs: Dict[str, Dict[str, Any]] = {}  # In-memory job storage
+        self.max_jobs = max_jobs if max_jobs is not None else self.MAX_JOBS
+        self.terminal_job_ttl = (
+            terminal_job_ttl if terminal_job_ttl is not None else self.TERMINAL_JOB_TTL
+        )
+        self._next_sweep = time.monotonic() + self.SWEEP_INTERVAL
+        # In-memory job storage. Records are never modified in place: writers
+        # publish an updated copy under _job_lock, so readers can use
+        # whatever record they find without locking.
+        self.jobs: Dict[str, Dict[str, Any]] = {}
         self._job_lock = threading.Lock()
+        self._done_callbacks: Dict[str, List[Callable[[], None]]] = {}
+        self._status_cache: Dict[str, Tuple[Dict[str, Any], JobStatus]] = {}
+        self._job_futures: Dict[str, Future] = {}
+        self._processes: Dict[str, subprocess.Popen] = {}
+        
+        # Jobs beyond max_concurrency wait in the executor's queue
+        self.max_concurrency = max_concurrency or (os.cpu_count() or 1) * 2
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="qetl-exec"
+        )
+        self._prewarm_done = threading.Event()
+        self._spool_dir = _default_spool_dir()
         
         # Validate QETL installation
         self._validate_installation()
         
-        logger.info(f"Local runner initialized with QETL_HOME: {self.qetl_home}")
+        # The pipeline runner command line, minus the per-job arguments
+        self._runner_cwd = str(self.qetl_home)
+        self._runner_cmd = (
+            sys.executable,
+            str(self.qetl_home / "yaml_pipeline_runner" / "main.py"),
+        )
+        
+        # Optionally compile the pipeline sources in the background so the
+        # first job's interpreter doesn't have to. Off by default because it
+        # writes __pycache__ files into the QETL installation.
+        if prewarm:
+            thread = threading.Thread(target=self._prewarm, name="qetl-prewarm")
+            thread.daemon = True
+            thread.start()
+        
+        _live_runners.add(self)
+        logger.info("Local runner initialized with QETL_HOME: %s", self.qetl_home)
+    
+    def _prewarm(self) -> None:
+        """Byte-compile the QETL installation's packages."""
+        try:
+            for package in self.PREWARM_PACKAGES:
+                package_dir = self.qetl_home / package
+                if package_dir.is_dir():
+                    compileall.compile_dir(str(package_dir), quiet=1)
+        except Exception as e:
+            # Prewarming is an optimization only; jobs compile on demand
+            logger.debug("Prewarm of %s failed: %s", self.qetl_home, e)
+        finally:
+            self._prewarm_done.set()
     
     def _find_qetl_home(self) -> Path:
         """Find QETL installation directory."""
-        # Check environment variable
-        if "QETL_HOME" in os.environ:
-            return Path(os.environ["QETL_HOME"])
-        
-        # Check current directory and parents
-        current = Path.cwd()
-        for path in [current] + list(current.parents):
-            if (path / "core" / "quantum_mathematics_engine.py").exists():
-                return path
-            if (path / "yaml_pipeline_runner" / "main.py").exists():
-                return path
+        found = _home.find_qetl_home()
+        if found is not None:
+            return Path(found)
         
         raise ConfigurationError("QETL installation not found. Set QETL_HOME environment variable.")
     
     def _validate_installation(self) -> None:
-        """Validate that QETL installation is complete."""
+        """
+        Validate that QETL installation is complete.
+        
+        The pipeline runner module is located without being imported, so
+        its import cost isn't paid here and ``sys.path`` is left untouched.
+        Each installation is only validated once per process.
+        """
+        home = str(self.qetl_home)
+        if home in LocalRunner._validated_homes:
+            return
+        
         required_paths = [
             self.qetl_home / "core" / "quantum_mathematics_engine.py",
             self.qetl_home / "yaml_pipeline_runner" / "main.py"
@@ -72,12 +271,21 @@ class LocalRunner:
             if not path.exists():
                 raise ConfigurationError(f"Required QETL component not found: {path}")
         
-        # Check if Python dependencies are available
-        try:
-            sys.path.insert(0, str(self.qetl_home))
-            import yaml_pipeline_runner.main
-        except ImportError as e:
-            raise ConfigurationError(f"QETL dependencies not available: {e}")
+        # Check the runner is importable from QETL_HOME
+        package = importlib.machinery.PathFinder.find_spec("yaml_pipeline_runner", [home])
+        if package is None or not package.submodule_search_locations:
+            raise ConfigurationError(
+                "QETL dependencies not available: yaml_pipeline_runner is not a package"
+            )
+        
+        if importlib.machinery.PathFinder.find_spec(
+            "main", list(package.submodule_search_locations)
+        ) is None:
+            raise ConfigurationError(
+                "QETL dependencies not available: yaml_pipeline_runner.main not found"
+            )
+        
+        LocalRunner._validated_homes.add(home)
     
     def submit_job(self, yaml_path: Path, **kwargs) -> Job:
         """
@@ -94,56 +302,113 @@ class LocalRunner:
         
         # Validate YAML first
         try:
-            self.validate_yaml(yaml_path)
+            config = self.validate_config(_yaml.load_config_file_cached(yaml_path))["config"]
+        except ValidationError as e:
+            logger.error("YAML validation failed for job %s: %s", job_id, e)
+            raise
+        
+        job = self._start_job(job_id, yaml_path, config, kwargs)
+        logger.info("Job %s submitted from %s", job_id, yaml_path)
+        return job
+    
+    def submit_job_config(self, config: Dict[str, Any], **kwargs) -> Job:
+        """
+        Submit a job from an in-memory configuration.
+        
+        The pipeline runner only reads configuration files, so the config is
+        written to a temporary file owned by the runner and removed once the
+        job has finished. The file is kept in ``/dev/shm`` when available so
+        it never touches disk.
+        
+        Args:
+            config: Job configuration dictionary
+            **kwargs: Additional job parameters
+            
+        Returns:
+            Job object for monitoring
+        """
+        job_id = str(uuid.uuid4())
+        
+        try:
+            self.validate_config(config)
         except ValidationError as e:
-            logger.error(f"YAML validation failed for job {job_id}: {e}")
+            logger.error("Configuration validation failed for job %s: %s", job_id, e)
             raise
         
+        fd, path = tempfile.mkstemp(
+            prefix=f"qetl-{job_id}-", suffix=".yaml", dir=self._spool_dir
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                _yaml.safe_dump(config, f)
+        except BaseException:
+            # Don't leave a half-written file behind, and never let the
+            # cleanup hide the original error
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            raise
+        
+        job = self._start_job(job_id, Path(path), config, kwargs, owns_yaml=True)
+        logger.info("Job %s submitted from configuration", job_id)
+        return job
+    
+    def _start_job(
+        self,
+        job_id: str,
+        yaml_path: Path,
+        config: Dict[str, Any],
+        kwargs: Dict[str, Any],
+        owns_yaml: bool = False
+    ) -> Job:
+        """Record a validated job and start executing it in the background."""
         # Create job record
+        now = _utcnow()
         job_data = {
             "job_id": job_id,
             "yaml_path": str(yaml_path),
+            "config": config,
+            "owns_yaml": owns_yaml,
             "status": JobState.SUBMITTED,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "created_at": now,
+            "updated_at": now,
             "progress": 0.0,
             "message": "Job submitted",
+            "logs": _LogBuffer(self.LOG_MAX_LINES),
             "kwargs": kwargs
         }
         
         with self._job_lock:
+            self._evict_jobs()
             self.jobs[job_id] = job_data
+            # Log followers stop once the job reaches a terminal state
+            self._done_callbacks[job_id] = [job_data["logs"].close]
         
-        # Start job execution in background thread
-        thread = threading.Thread(target=self._execute_job, args=(job_id,))
-        thread.daemon = True
-        thread.start()
-        
-        initial_status = JobStatus(
-            job_id=job_id,
-            state=JobState.SUBMITTED,
-            progress=0.0,
-            message="Job submitted",
-            created_at=job_data["created_at"]
-        )
+        # Queue the job on the runner's worker pool
+        future = self._executor.submit(self._execute_job, job_id)
+        with self._job_lock:
+            if job_id in self.jobs:
+                self._job_futures[job_id] = future
         
-        logger.info(f"Job {job_id} submitted from {yaml_path}")
-        return Job(job_id, self, initial_status)
+        return Job(job_id, self, self._cached_status(job_id, job_data))
     
     def _execute_job(self, job_id: str) -> None:
         """Execute job in background thread."""
+        owned_yaml = None
         try:
-            with self._job_lock:
-                job_data = self.jobs[job_id].copy()
+            job_data = self.jobs[job_id]
             
             yaml_path = Path(job_data["yaml_path"])
+            if job_data["owns_yaml"]:
+                owned_yaml = yaml_path
             
-            # Update status to validating
-            self._update_job_status(job_id, JobState.VALIDATING, 10.0, "Validating configuration")
+            # Cancelled while waiting in the queue
+            if job_data["status"].is_terminal:
+                return
             
-            # Load and validate YAML
-            with open(yaml_path, 'r') as f:
-                config = yaml.safe_load(f)
+            # The configuration was parsed and validated at submission
+            self._update_job_status(job_id, JobState.VALIDATING, 10.0, "Validating configuration")
             
             # Update status to queued
             self._update_job_status(job_id, JobState.QUEUED, 20.0, "Job queued for execution")
@@ -152,12 +417,12 @@ class LocalRunner:
             self._update_job_status(job_id, JobState.INITIALIZING, 30.0, "Initializing execution environment")
             
             # Update status to running
-            self._update_job_status(job_id, JobState.RUNNING, 40.0, "Executing pipeline")
+            self._update_job_status(job_id, JobState.RUNNING, RUN_PROGRESS_START, "Executing pipeline")
             
             # Execute the pipeline using the existing YAML runner
-            start_time = time.time()
+            start_time = time.monotonic()
             result = self._run_yaml_pipeline(yaml_path, job_id)
-            execution_time = time.time() - start_time
+            execution_time = time.monotonic() - start_time
             
             # Update status to completing
             self._update_job_status(job_id, JobState.COMPLETING, 90.0, "Processing results")
@@ -171,30 +436,49 @@ class LocalRunner:
                 metrics=result.get("metrics", {})
             )
             
-            with self._job_lock:
-                self.jobs[job_id]["results"] = job_results
-            
-            # Update status to completed
-            self._update_job_status(job_id, JobState.COMPLETED, 100.0, "Job completed successfully")
+            # Update status to completed, publishing the results with it
+            self._update_job_status(
+                job_id, JobState.COMPLETED, 100.0, "Job completed successfully",
+                results=job_results
+            )
             
-            logger.info(f"Job {job_id} completed successfully in {execution_time:.2f} seconds")
+            logger.info("Job %s completed successfully in %.2f seconds", job_id, execution_time)
             
         except Exception as e:
-            logger.error(f"Job {job_id} failed: {e}")
-            self._update_job_status(job_id, JobState.FAILED, progress=None, message=str(e))
+            job_data = self.jobs.get(job_id)
+            if job_data is not None and job_data["status"] is JobState.CANCELLED:
+                # cancel_job killed the pipeline; the job stays cancelled
+                logger.info("Job %s stopped after cancellation", job_id)
+                return
             
-            # Store error information
-            with self._job_lock:
-                self.jobs[job_id]["error"] = {
+            logger.error("Job %s failed: %s", job_id, e)
+            
+            # Store error information along with the failed status
+            self._update_job_status(
+                job_id, JobState.FAILED, progress=None, message=str(e),
+                error={
                     "type": type(e).__name__,
                     "message": str(e),
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _utcnow().isoformat()
                 }
+            )
+        finally:
+            # Remove configuration files written by submit_job_config
+            if owned_yaml is not None:
+                try:
+                    owned_yaml.unlink()
+                except OSError:
+                    pass
     
     def _run_yaml_pipeline(self, yaml_path: Path, job_id: str) -> Dict[str, Any]:
         """
         Execute the YAML pipeline using the existing runner.
         
+        The runner's output is read line by line as it is produced: each
+        line is appended to the job's logs, scanned for outputs and progress
+        markers, and then dropped, so memory use stays bounded no matter how
+        much the pipeline prints.
+        
         Args:
             yaml_path: Path to YAML configuration
             job_id: Job identifier for logging
@@ -203,148 +487,424 @@ class LocalRunner:
             Dictionary containing execution results
         """
         try:
-            # Set up environment
+            logs = self.jobs[job_id]["logs"]
+            
+            # Set up environment; read per job so changes to os.environ apply
             env = os.environ.copy()
-            env["PYTHONPATH"] = str(self.qetl_home)
+            env["PYTHONPATH"] = self._runner_cwd
             
             # Run the YAML pipeline runner
-            runner_path = self.qetl_home / "yaml_pipeline_runner" / "main.py"
-            cmd = [
-                sys.executable,
-                str(runner_path),
-                "--config", str(yaml_path),
-                "--job-id", job_id
-            ]
+            cmd = [*self._runner_cmd, "--config", str(yaml_path), "--job-id", job_id]
             
-            # Execute with timeout
-            process = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
-                cwd=str(self.qetl_home),
+                cwd=self._runner_cwd,
                 env=env,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=self.timeout
+                errors="replace",
+                bufsize=1
+            )
+            with self._job_lock:
+                self._processes[job_id] = process
+                job_data = self.jobs.get(job_id)
+            
+            # cancel_job kills registered processes; one cancelled while it
+            # was being started is killed here
+            if job_data is None or job_data["status"] is JobState.CANCELLED:
+                process.kill()
+            
+            # Drain stderr concurrently so a chatty pipeline can't fill the
+            # pipe and stall while we're reading stdout
+            stderr_lines = deque(maxlen=self.LOG_MAX_LINES)
+            stderr_reader = threading.Thread(
+                target=stderr_lines.extend, args=(process.stderr,), daemon=True
             )
+            stderr_reader.start()
+            
+            timed_out = threading.Event()
+            
+            def kill_on_timeout():
+                timed_out.set()
+                process.kill()
             
-            if process.returncode != 0:
-                raise JobExecutionError(f"Pipeline execution failed: {process.stderr}")
+            timer = threading.Timer(self.timeout, kill_on_timeout)
+            timer.daemon = True
+            timer.start()
+            
+            outputs: Dict[str, Any] = {}
+            progress = RUN_PROGRESS_START
+            progress_scale = (RUN_PROGRESS_END - RUN_PROGRESS_START) / 100.0
+            
+            def report_progress(reported: float, message: str = "Executing pipeline") -> None:
+                nonlocal progress
+                new_progress = RUN_PROGRESS_START + min(reported, 100.0) * progress_scale
+                if new_progress > progress:
+                    progress = new_progress
+                    self._update_job_status(job_id, JobState.RUNNING, progress, message)
+            
+            try:
+                for line in process.stdout:
+                    line = line.rstrip("\n")
+                    
+                    if self._parse_output_line(line, outputs, logs, report_progress):
+                        continue
+                    
+                    match = _PROGRESS_RE.search(line)
+                    if match:
+                        report_progress(float(match.group(1)))
+                
+                returncode = process.wait()
+                stderr_reader.join()
+            except BaseException:
+                process.kill()
+                raise
+            finally:
+                timer.cancel()
+                with self._job_lock:
+                    self._processes.pop(job_id, None)
+                process.stdout.close()
+                process.stderr.close()
+            
+            if timed_out.is_set():
+                raise JobExecutionError(f"Pipeline execution timed out after {self.timeout} seconds")
+            
+            if returncode != 0:
+                raise JobExecutionError(f"Pipeline execution failed: {''.join(stderr_lines)}")
+            
+            # Default output if no specific patterns found
+            if not outputs:
+                outputs = {
+                    "status": "completed",
+                    "message": "Pipeline execution completed",
+                    "stdout": "\n".join(logs.snapshot())
+                }
             
-            # Parse output for results
             result = {
-                "outputs": self._parse_pipeline_outputs(process.stdout),
-                "logs": process.stdout.split('\n') if process.stdout else [],
+                "outputs": outputs,
+                "logs": logs.snapshot(),
                 "metrics": {
-                    "return_code": process.returncode,
+                    "return_code": returncode,
                     "execution_command": ' '.join(cmd)
                 }
             }
             
             return result
             
-        except subprocess.TimeoutExpired:
-            raise JobExecutionError(f"Pipeline execution timed out after {self.timeout} seconds")
+        except JobExecutionError:
+            raise
         except Exception as e:
             raise JobExecutionError(f"Failed to execute pipeline: {e}")
     
-    def _parse_pipeline_outputs(self, stdout: str) -> Dict[str, Any]:
+    def _parse_event(self, payload: str) -> Optional[Dict[str, Any]]:
         """
-        Parse pipeline outputs from stdout.
+        Decode the JSON payload of a runner event line.
         
-        This is a simplified parser - in practice, the YAML runner would
-        need to be modified to output structured results.
+        Returns:
+            The event, or None if the payload is not a JSON object, in which
+            case the line is handled as plain output
         """
-        outputs = {}
-        
-        if not stdout:
-            return outputs
-        
-        # Look for output patterns in the logs
-        lines = stdout.split('\n')
-        for line in lines:
-            if 'Processing complete' in line:
-                outputs['status'] = 'completed'
-            elif 'Results saved to' in line:
-                # Extract file path
-                parts = line.split('Results saved to')
-                if len(parts) > 1:
-                    outputs['result_path'] = parts[1].strip()
-        
-        # Default output if no specific patterns found
-        if not outputs:
-            outputs = {
-                "status": "completed",
-                "message": "Pipeline execution completed",
-                "stdout": stdout
-            }
+        try:
+            event = _json.loads(payload)
+        except ValueError:
+            logger.debug("Ignoring malformed runner event: %s", payload)
+            return None
+        return event if isinstance(event, dict) else None
+    
+    def _handle_event(
+        self,
+        event: Dict[str, Any],
+        outputs: Dict[str, Any],
+        logs: _LogBuffer,
+        report_progress: Callable[..., None]
+    ) -> None:
+        """
+        Apply a structured event reported by the pipeline runner.
         
-        return outputs
+        ``progress`` events (``pct`` and optional ``message``) update the job
+        status, ``output`` events (``name`` and ``value``) are stored in the
+        job outputs and ``log`` events (``msg``) are appended to the logs.
+        Unknown event types are ignored.
+        """
+        event_type = event.get("type")
+        if event_type == "output":
+            name = event.get("name")
+            if isinstance(name, str):
+                outputs[name] = event.get("value")
+        elif event_type == "progress":
+            try:
+                pct = float(event["pct"])
+            except (KeyError, TypeError, ValueError):
+                return
+            report_progress(pct, event.get("message") or "Executing pipeline")
+        elif event_type == "log":
+            logs.append(str(event.get("msg", "")))
+    
+    def _parse_output_line(
+        self,
+        line: str,
+        outputs: Dict[str, Any],
+        logs: _LogBuffer,
+        report_progress: Callable[..., None]
+    ) -> bool:
+        """
+        Handle a single line of pipeline output.
+        
+        ``QETL-EVENT:`` lines are applied through ``_handle_event`` and not
+        logged. Any other line is appended to the logs and scanned for the
+        runner's plain-text output markers.
+        
+        Args:
+            line: Output line without its trailing newline
+            outputs: Job outputs collected so far
+            logs: Log buffer of the job
+            report_progress: Callback taking a runner-reported percentage
+            
+        Returns:
+            True if the line was a runner event
+        """
+        if line.startswith(EVENT_PREFIX):
+            event = self._parse_event(line[len(EVENT_PREFIX):])
+            if event is not None:
+                self._handle_event(event, outputs, logs, report_progress)
+                return True
+        
+        logs.append(line)
+        if 'Processing complete' in line:
+            outputs['status'] = 'completed'
+        elif 'Results saved to' in line:
+            # Extract file path
+            parts = line.split('Results saved to')
+            if len(parts) > 1:
+                outputs['result_path'] = parts[1].strip()
+        return False
     
     def _update_job_status(
         self, 
         job_id: str, 
         state: JobState, 
         progress: Optional[float], 
-        message: str
+        message: str,
+        **fields
     ) -> None:
-        """Update job status."""
+        """
+        Update job status.
+        
+        Publishes a new record for the job; ``fields`` are stored in the same
+        record so readers see them together with the new status.
+        """
+        callbacks = None
         with self._job_lock:
-            if job_id in self.jobs:
-                self.jobs[job_id].update({
+            job_data = self.jobs.get(job_id)
+            # A cancelled job stays cancelled even if its thread carries on
+            if job_data is not None and not job_data["status"].is_terminal:
+                job_data = {
+                    **job_data,
+                    **fields,
                     "status": state,
                     "progress": progress,
                     "message": message,
-                    "updated_at": datetime.now(timezone.utc)
-                })
+                    "updated_at": _utcnow()
+                }
+                if state.is_terminal:
+                    job_data["expires_at"] = self._expiry_time()
+                    callbacks = self._done_callbacks.pop(job_id, None)
+                self.jobs[job_id] = job_data
+        
+        if callbacks:
+            self._run_done_callbacks(job_id, callbacks)
     
-    def get_job_status(self, job_id: str) -> JobStatus:
-        """Get current job status."""
+    def _expiry_time(self) -> float:
+        """Monotonic time at which a job finishing now may be purged."""
+        jitter = random.uniform(0, self.TERMINAL_JOB_TTL_JITTER)
+        return time.monotonic() + self.terminal_job_ttl * (1 + jitter)
+    
+    def _evict_jobs(self) -> None:
+        """
+        Purge expired jobs and make room for a new one.
+        
+        Finished jobs are dropped once their TTL has passed (checked at most
+        every ``SWEEP_INTERVAL`` seconds) and, if the runner is still at
+        ``max_jobs``, oldest first. Jobs that are still running are never
+        dropped. Must be called with ``_job_lock`` held.
+        """
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.SWEEP_INTERVAL
+            expired = [
+                job_id for job_id, job_data in self.jobs.items()
+                if job_data.get("expires_at", now) < now
+            ]
+            for job_id in expired:
+                self._drop_job(job_id)
+        
+        if len(self.jobs) < self.max_jobs:
+            return
+        
+        # Records are kept in submission order, so this visits the oldest first
+        for job_id, job_data in list(self.jobs.items()):
+            if job_data["status"].is_terminal:
+                self._drop_job(job_id)
+                if len(self.jobs) < self.max_jobs:
+                    break
+    
+    def _drop_job(self, job_id: str) -> None:
+        """Forget a finished job. Must be called with ``_job_lock`` held."""
+        del self.jobs[job_id]
+        self._status_cache.pop(job_id, None)
+        self._job_futures.pop(job_id, None)
+    
+    def add_done_callback(self, job_id: str, callback: Callable[[], None]) -> None:
+        """
+        Call ``callback`` once the job reaches a terminal state.
+        
+        Waiters are notified by the thread that finishes the job instead of
+        each polling the job table. If the job has already finished, the
+        callback runs immediately in the calling thread.
+        
+        Args:
+            job_id: Job identifier
+            callback: Function called without arguments
+            
+        Raises:
+            QETLError: If the job does not exist
+        """
         with self._job_lock:
             if job_id not in self.jobs:
                 raise QETLError(f"Job not found: {job_id}")
             
-            job_data = self.jobs[job_id]
-            
-            return JobStatus(
-                job_id=job_id,
-                state=job_data["status"],
-                progress=job_data.get("progress", 0.0),
-                message=job_data.get("message", ""),
-                created_at=job_data["created_at"],
-                updated_at=job_data["updated_at"]
-            )
+            callbacks = self._done_callbacks.get(job_id)
+            if callbacks is not None:
+                callbacks.append(callback)
+                return
+        
+        callback()
+    
+    def _run_done_callbacks(self, job_id: str, callbacks: List[Callable[[], None]]) -> None:
+        """Run done callbacks outside the job lock."""
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                # A waiter that went away must not break the job thread
+                logger.debug("Done callback for job %s failed: %s", job_id, e)
+    
+    def _cached_status(self, job_id: str, job_data: Dict[str, Any]) -> JobStatus:
+        """
+        Return the JobStatus for a job record, building it only when needed.
+        
+        The cached status is tied to the record it was built from; since
+        every change publishes a new record, repeated reads between updates
+        share one JobStatus instead of allocating a new one per poll.
+        Must be called without ``_job_lock`` held.
+        """
+        cached = self._status_cache.get(job_id)
+        if cached is not None and cached[0] is job_data:
+            return cached[1]
+        
+        status = JobStatus(
+            job_id=job_id,
+            state=job_data["status"],
+            progress=job_data.get("progress", 0.0),
+            message=job_data.get("message", ""),
+            created_at=job_data["created_at"],
+            updated_at=job_data["updated_at"]
+        )
+        with self._job_lock:
+            # Only cache statuses of published records, so a reader racing
+            # _drop_job can't leave an entry behind for an evicted job
+            if self.jobs.get(job_id) is job_data:
+                self._status_cache[job_id] = (job_data, status)
+        return status
+    
+    def get_job_status(self, job_id: str) -> JobStatus:
+        """Get current job status."""
+        job_data = self.jobs.get(job_id)
+        if job_data is None:
+            raise QETLError(f"Job not found: {job_id}")
+        
+        return self._cached_status(job_id, job_data)
     
     def get_job_results(self, job_id: str) -> JobResults:
         """Get job results."""
-        with self._job_lock:
-            if job_id not in self.jobs:
-                raise QETLError(f"Job not found: {job_id}")
-            
-            job_data = self.jobs[job_id]
-            
-            if "results" not in job_data:
-                raise QETLError(f"Results not available for job {job_id}")
-            
-            return job_data["results"]
+        job_data = self.jobs.get(job_id)
+        if job_data is None:
+            raise QETLError(f"Job not found: {job_id}")
+        
+        if "results" not in job_data:
+            raise QETLError(f"Results not available for job {job_id}")
+        
+        return job_data["results"]
     
     def cancel_job(self, job_id: str) -> bool:
-        """Cancel a running job."""
+        """
+        Cancel a queued or running job.
+        
+        A queued job is removed from the worker pool's queue; the pipeline
+        of a running job is killed so its worker is free for the next job.
+        """
         with self._job_lock:
-            if job_id not in self.jobs:
+            job_data = self.jobs.get(job_id)
+            if job_data is None:
                 return False
             
-            job_data = self.jobs[job_id]
-            
             if job_data["status"].is_terminal:
                 return False
             
             # Update status to cancelled
-            self.jobs[job_id].update({
+            self.jobs[job_id] = {
+                **job_data,
                 "status": JobState.CANCELLED,
                 "message": "Job cancelled by user",
-                "updated_at": datetime.now(timezone.utc)
-            })
-            
-            return True
+                "updated_at": _utcnow(),
+                "expires_at": self._expiry_time()
+            }
+            callbacks = self._done_callbacks.pop(job_id, None)
+            future = self._job_futures.get(job_id)
+            process = self._processes.get(job_id)
+        
+        if process is not None:
+            process.kill()
+        
+        # A job still waiting for a worker never has to start; its thread
+        # would otherwise see the cancelled status and return immediately
+        if future is not None and future.cancel() and job_data["owns_yaml"]:
+            try:
+                os.unlink(job_data["yaml_path"])
+            except OSError:
+                pass
+        
+        if callbacks:
+            self._run_done_callbacks(job_id, callbacks)
+        
+        return True
+    
+    def cleanup(self, kill_running: bool = False) -> None:
+        """
+        Cancel queued jobs and stop the worker pool.
+        
+        Called for every live runner at interpreter exit with
+        ``kill_running=True``, so exiting doesn't wait for running jobs.
+        
+        Args:
+            kill_running: Kill the pipelines of running jobs, which then
+                fail; by default they are left to finish
+        """
+        with self._job_lock:
+            futures = list(self._job_futures.items())
+        
+        for job_id, future in futures:
+            if not future.running() and not future.done():
+                self.cancel_job(job_id)
+        
+        self._executor.shutdown(wait=False)
+        
+        if kill_running:
+            with self._job_lock:
+                processes = list(self._processes.values())
+            for process in processes:
+                process.kill()
     
     def list_jobs(
         self, 
@@ -353,47 +913,59 @@ class LocalRunner:
         **kwargs
     ) -> List[Job]:
         """List jobs with optional filtering."""
-        with self._job_lock:
-            jobs = []
-            
-            for job_id, job_data in list(self.jobs.items()):
-                if status and job_data["status"].value != status:
-                    continue
-                
-                job_status = JobStatus(
-                    job_id=job_id,
-                    state=job_data["status"],
-                    progress=job_data.get("progress", 0.0),
-                    message=job_data.get("message", ""),
-                    created_at=job_data["created_at"],
-                    updated_at=job_data["updated_at"]
-                )
-                
-                jobs.append(Job(job_id, self, job_status))
-                
-                if len(jobs) >= limit:
-                    break
-            
-            return jobs
+        records = list(self.jobs.items())
+        
+        if status:
+            try:
+                target = JobState(status)
+            except ValueError:
+                # No job can be in an unknown state
+                return []
+            records = (
+                (job_id, job_data) for job_id, job_data in records
+                if job_data["status"] is target
+            )
+        
+        cached_status = self._cached_status
+        return [
+            Job(job_id, self, cached_status(job_id, job_data))
+            for job_id, job_data in itertools.islice(records, max(limit, 0))
+        ]
     
     def get_job(self, job_id: str) -> Job:
         """Get specific job by ID."""
         status = self.get_job_status(job_id)
         return Job(job_id, self, status)
     
-    def get_job_logs(self, job_id: str, follow: bool = False) -> List[str]:
-        """Get job logs."""
-        with self._job_lock:
-            if job_id not in self.jobs:
-                raise QETLError(f"Job not found: {job_id}")
-            
-            job_data = self.jobs[job_id]
-            
-            if "results" in job_data:
-                return job_data["results"].logs
+    def get_job_logs(self, job_id: str, follow: bool = False) -> Union[List[str], Iterator[str]]:
+        """
+        Get job logs.
+        
+        Args:
+            job_id: Job identifier
+            follow: Return an iterator that yields the output so far and
+                then each new line as the pipeline prints it, ending when
+                the job finishes
             
-            # Return status messages as logs if results not available
-            return [job_data.get("message", "No logs available")]
+        Returns:
+            List of log lines, or an iterator of lines when following
+        """
+        job_data = self.jobs.get(job_id)
+        if job_data is None:
+            raise QETLError(f"Job not found: {job_id}")
+        
+        if follow:
+            return job_data["logs"].follow()
+        
+        if "results" in job_data:
+            return job_data["results"].logs
+        
+        # Output streamed so far by a running pipeline
+        if job_data["logs"]:
+            return job_data["logs"].snapshot()
+        
+        # Return status messages as logs if results not available
+        return [job_data.get("message", "No logs available")]
     
     def list_components(self) -> List[Dict[str, Any]]:
         """List available QETL components."""
@@ -435,32 +1007,36 @@ class LocalRunner:
         return components
     
     def validate_yaml(self, yaml_path: Path) -> Dict[str, Any]:
-        """Validate YAML configuration."""
-        try:
-            with open(yaml_path, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            # Basic validation
-            required_fields = ["pipeline_name", "input_sources", "transformations"]
-            errors = []
-            
-            for field in required_fields:
-                if field not in config:
-                    errors.append(f"Missing required field: {field}")
-            
-            if errors:
-                raise ValidationError("YAML validation failed", validation_errors=errors)
-            
-            return {
-                "valid": True,
-                "message": "YAML configuration is valid",
-                "config": config
-            }
-            
-        except yaml.YAMLError as e:
-            raise ValidationError(f"Invalid YAML format: {e}")
-        except FileNotFoundError:
-            raise ValidationError(f"YAML file not found: {yaml_path}")
+        """
+        Validate YAML configuration.
+        
+        Shares the parse cache with ``submit_job``, so validating a file and
+        then submitting it unchanged parses the YAML only once.
+        """
+        return self.validate_config(_yaml.load_config_file_cached(yaml_path))
+    
+    def validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate an already parsed job configuration."""
+        if not isinstance(config, dict):
+            raise ValidationError(
+                "Configuration validation failed",
+                validation_errors=["Configuration must be a mapping"]
+            )
+        
+        errors = [
+            f"Missing required field: {field}"
+            for field in REQUIRED_CONFIG_FIELDS
+            if field not in config
+        ]
+        
+        if errors:
+            raise ValidationError("Configuration validation failed", validation_errors=errors)
+        
+        return {
+            "valid": True,
+            "message": "Configuration is valid",
+            "config": config
+        }
     
     def get_instance_info(self) -> Dict[str, Any]:
         """Get local instance information."""
@@ -468,6 +1044,7 @@ class LocalRunner:
             "mode": "local",
             "qetl_home": str(self.qetl_home),
             "python_version": sys.version,
-            "active_jobs": len([j for j in self.jobs.values() if not j["status"].is_terminal]),
-            "total_jobs": len(self.jobs)
+            "active_jobs": sum(1 for j in list(self.jobs.values()) if not j["status"].is_terminal),
+            "total_jobs": len(self.jobs),
+            "prewarm_done": self._prewarm_done.is_set()
         }
@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the QETL SDK tests
+"""
+
+import json
+
+import pytest
+
+from qetl_sdk._yaml import safe_dump
+
+
+@pytest.fixture(scope="session")
+def _yaml_files():
+    """Pipeline files written this session, keyed by their content."""
+    return {}
+
+
+@pytest.fixture
+def yaml_file(request, tmp_path_factory, _yaml_files):
+    """
+    Pipeline YAML file holding the configuration given as the parameter.
+    
+    Use with ``@pytest.mark.parametrize("yaml_file", [config], indirect=True)``.
+    Each distinct configuration is written once per session, so tests must
+    treat the file as read-only.
+    """
+    key = json.dumps(request.param, sort_keys=True)
+    path = _yaml_files.get(key)
+    if path is None:
+        path = tmp_path_factory.mktemp("yaml") / "pipeline.yaml"
+        path.write_text(safe_dump(request.param))
+        _yaml_files[key] = path
+    return path
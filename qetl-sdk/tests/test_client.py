@@ -3,157 +3,265 @@ Tests for QETL SDK Client
 """
 
 import pytest
-import tempfile
-import yaml
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, call
 
+from qetl_sdk import _yaml
+from qetl_sdk._yaml import safe_dump
 from qetl_sdk.client import QETLClient
+from qetl_sdk.cloud_client import CloudClient
 from qetl_sdk.exceptions import QETLError, ConfigurationError
 from qetl_sdk.job import JobState
 
 
+@pytest.fixture
+def mock_backend():
+    """Backend instance returned by the patched LocalRunner."""
+    return Mock()
+
+
+@pytest.fixture(autouse=True)
+def mock_runner(monkeypatch, mock_backend):
+    """Replace LocalRunner so no test touches a real QETL installation."""
+    runner = Mock(return_value=mock_backend)
+    monkeypatch.setattr('qetl_sdk.local_runner.LocalRunner', runner)
+    return runner
+
+
 class TestQETLClient:
     """Test cases for QETLClient."""
     
-    def test_init_local_mode(self):
+    def test_init_local_mode(self, mock_runner):
         """Test client initialization in local mode."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            client = QETLClient(mode="local")
-            assert client.mode == "local"
-            mock_runner.assert_called_once()
+        client = QETLClient(mode="local")
+        assert client.mode == "local"
+        assert mock_runner.call_count == 1
     
-    def test_init_cloud_mode(self):
+    def test_init_cloud_mode(self, monkeypatch):
         """Test client initialization in cloud mode."""
-        with patch('qetl_sdk.client.CloudClient') as mock_client:
-            client = QETLClient(mode="cloud", instance_id="test-instance", api_key="test-key")
-            assert client.mode == "cloud"
-            mock_client.assert_called_once_with(
-                instance_id="test-instance",
-                api_key="test-key",
-                base_url=None,
-                timeout=300
-            )
+        mock_client = Mock()
+        monkeypatch.setattr('qetl_sdk.cloud_client.CloudClient', mock_client)
+        
+        client = QETLClient(mode="cloud", instance_id="test-instance", api_key="test-key")
+        assert client.mode == "cloud"
+        assert mock_client.call_count == 1
+        assert mock_client.call_args == call(
+            instance_id="test-instance",
+            api_key="test-key",
+            base_url=None,
+            timeout=300
+        )
     
     def test_init_cloud_mode_no_api_key(self):
         """Test cloud mode initialization without API key."""
         with pytest.raises(QETLError, match="API key is required"):
             QETLClient(mode="cloud")
     
-    def test_submit_job_local(self):
+    @pytest.mark.parametrize("yaml_file", [{"pipeline_name": "test"}], indirect=True)
+    def test_submit_job_local(self, mock_backend, yaml_file):
         """Test job submission in local mode."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_runner.return_value = mock_backend
-            
-            client = QETLClient(mode="local")
-            
-            # Create temporary YAML file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                yaml.dump({"pipeline_name": "test"}, f)
-                yaml_path = Path(f.name)
-            
-            try:
-                client.submit_job(yaml_path)
-                mock_backend.submit_job.assert_called_once()
-            finally:
-                yaml_path.unlink()
+        client = QETLClient(mode="local")
+        client.submit_job(yaml_file)
+        assert mock_backend.submit_job.call_count == 1
+    
+    def test_submit_job_cloud_parses_unchanged_file_once(self, monkeypatch, tmp_path):
+        """Test resubmitting an unchanged YAML file reuses the parsed config."""
+        submit_config = Mock()
+        monkeypatch.setattr(CloudClient, "submit_job_config", submit_config)
+        load = Mock(wraps=_yaml.load_config_file)
+        monkeypatch.setattr(_yaml, "load_config_file", load)
+        
+        yaml_path = tmp_path / "pipeline.yaml"
+        yaml_path.write_text(safe_dump({"pipeline_name": "test"}))
+        
+        client = QETLClient(mode="cloud", instance_id="test-instance", api_key="test-key")
+        client.submit_job(yaml_path)
+        # Each submission gets its own copy of the cached config
+        submit_config.call_args[0][0]["pipeline_name"] = "changed"
+        client.submit_job(yaml_path)
+        
+        assert load.call_count == 1
+        assert submit_config.call_count == 2
+        assert submit_config.call_args == call({"pipeline_name": "test"})
+    
+    def test_submit_job_config(self, mock_backend):
+        """Test job submission from a configuration dictionary."""
+        client = QETLClient(mode="local")
+        config = {"pipeline_name": "test"}
+        client.submit_job_config(config, priority=80)
+        
+        assert mock_backend.submit_job_config.call_count == 1
+        assert mock_backend.submit_job_config.call_args == call(config, priority=80)
     
     def test_submit_job_file_not_found(self):
         """Test job submission with non-existent file."""
-        with patch('qetl_sdk.client.LocalRunner'):
-            client = QETLClient(mode="local")
+        client = QETLClient(mode="local")
 
-            with pytest.raises(QETLError, match="YAML file not found"):
-                client.submit_job(Path("nonexistent.yaml"))
+        with pytest.raises(QETLError, match="YAML file not found"):
+            client.submit_job(Path("nonexistent.yaml"))
+    
+    def test_submit_jobs(self, mock_backend, tmp_path):
+        """Test batch job submission."""
+        client = QETLClient(mode="local")
+        
+        yaml_paths = []
+        for i in range(3):
+            yaml_path = tmp_path / f"pipeline_{i}.yaml"
+            yaml_path.write_text(safe_dump({"pipeline_name": f"test {i}"}))
+            yaml_paths.append(yaml_path)
+        
+        jobs = client.submit_jobs(yaml_paths, priority=80)
+        
+        assert len(jobs) == 3
+        assert mock_backend.submit_job.call_count == 3
+        assert mock_backend.submit_job.call_args == call(yaml_paths[-1], priority=80)
+    
+    def test_submit_jobs_missing_file(self, mock_backend):
+        """Test batch submission submits nothing if a file is missing."""
+        client = QETLClient(mode="local")
+        
+        with pytest.raises(QETLError, match="YAML file not found"):
+            client.submit_jobs([Path("nonexistent.yaml")])
+        
+        assert mock_backend.submit_job.call_count == 0
     
-    def test_list_jobs(self):
+    def test_submit_jobs_continue_on_failure(self, mock_backend, tmp_path):
+        """Test batch submission skips failed jobs by default."""
+        good_job = Mock()
+        mock_backend.submit_job.side_effect = [QETLError("boom"), good_job]
+        
+        client = QETLClient(mode="local")
+        
+        yaml_paths = []
+        for i in range(2):
+            yaml_path = tmp_path / f"pipeline_{i}.yaml"
+            yaml_path.write_text(safe_dump({"pipeline_name": f"test {i}"}))
+            yaml_paths.append(yaml_path)
+        
+        jobs = client.submit_jobs(yaml_paths)
+        
+        assert jobs == [good_job]
+    
+    def test_submit_jobs_stop_on_failure(self, mock_backend, tmp_path):
+        """Test a batch stopped by a failure reports the jobs already submitted."""
+        first_job = Mock()
+        mock_backend.submit_job.side_effect = [first_job, QETLError("boom"), Mock()]
+        
+        client = QETLClient(mode="local")
+        
+        yaml_paths = []
+        for i in range(3):
+            yaml_path = tmp_path / f"pipeline_{i}.yaml"
+            yaml_path.write_text(safe_dump({"pipeline_name": f"test {i}"}))
+            yaml_paths.append(yaml_path)
+        
+        with pytest.raises(QETLError, match="Job submission failed") as exc_info:
+            client.submit_jobs(yaml_paths, continue_on_failure=False)
+        
+        assert exc_info.value.details == {"submitted": [first_job]}
+        assert mock_backend.submit_job.call_count == 2
+    
+    def test_list_jobs(self, mock_runner):
         """Test job listing."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_backend.list_jobs.return_value = []
-            mock_runner.return_value = mock_backend
-            
-            client = QETLClient(mode="local")
-            jobs = client.list_jobs()
-            
-            assert isinstance(jobs, list)
-            mock_backend.list_jobs.assert_called_once()
-    
-    def test_get_job(self):
+        calls = []
+        mock_runner.return_value = SimpleNamespace(
+            list_jobs=lambda *args, **kwargs: calls.append((args, kwargs)) or []
+        )
+        
+        client = QETLClient(mode="local")
+        jobs = client.list_jobs(status="running", limit=10)
+        
+        assert jobs == []
+        assert calls == [((), {"status": "running", "limit": 10})]
+    
+    def test_get_job(self, mock_backend):
         """Test getting specific job."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_runner.return_value = mock_backend
-            
-            client = QETLClient(mode="local")
-            client.get_job("test-job-id")
-            
-            mock_backend.get_job.assert_called_once_with("test-job-id")
-    
-    def test_list_components(self):
+        client = QETLClient(mode="local")
+        client.get_job("test-job-id")
+        
+        assert mock_backend.get_job.call_count == 1
+        assert mock_backend.get_job.call_args == call("test-job-id")
+    
+    def test_list_components(self, mock_runner):
         """Test component listing."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_backend.list_components.return_value = []
-            mock_runner.return_value = mock_backend
-            
-            client = QETLClient(mode="local")
-            components = client.list_components()
-            
-            assert isinstance(components, list)
-            mock_backend.list_components.assert_called_once()
-    
-    def test_validate_yaml(self):
+        calls = []
+        mock_runner.return_value = SimpleNamespace(
+            list_components=lambda *args, **kwargs: calls.append((args, kwargs)) or []
+        )
+        
+        client = QETLClient(mode="local")
+        components = client.list_components()
+        
+        assert components == []
+        assert calls == [((), {})]
+    
+    def test_list_components_cached(self, mock_backend):
+        """Test component listing is cached until refreshed."""
+        mock_backend.list_components.return_value = [{"name": "wave_encoder"}]
+        
+        client = QETLClient(mode="local")
+        first = client.list_components()
+        second = client.list_components()
+        
+        assert first == second
+        assert mock_backend.list_components.call_count == 1
+        
+        client.list_components(refresh=True)
+        assert mock_backend.list_components.call_count == 2
+    
+    @pytest.mark.parametrize("yaml_file", [{"pipeline_name": "test"}], indirect=True)
+    def test_validate_yaml(self, mock_runner, yaml_file):
         """Test YAML validation."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_backend.validate_yaml.return_value = {"valid": True}
-            mock_runner.return_value = mock_backend
-            
-            client = QETLClient(mode="local")
-            
-            # Create temporary YAML file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                yaml.dump({"pipeline_name": "test"}, f)
-                yaml_path = Path(f.name)
-            
-            try:
-                result = client.validate_yaml(yaml_path)
-                assert result["valid"] is True
-                mock_backend.validate_yaml.assert_called_once()
-            finally:
-                yaml_path.unlink()
-    
-    def test_get_instance_info(self):
-        """Test instance info retrieval."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_backend.get_instance_info.return_value = {"mode": "local"}
-            mock_runner.return_value = mock_backend
-            
-            client = QETLClient(mode="local")
-            info = client.get_instance_info()
-            
-            assert info["mode"] == "local"
-            mock_backend.get_instance_info.assert_called_once()
+        calls = []
+        mock_runner.return_value = SimpleNamespace(
+            validate_yaml=lambda *args, **kwargs: calls.append((args, kwargs)) or {"valid": True}
+        )
+        
+        client = QETLClient(mode="local")
+        result = client.validate_yaml(str(yaml_file))
+        assert result["valid"] is True
+        assert calls == [((yaml_file,), {})]
+    
+    def test_validate_config(self, mock_backend):
+        """Test in-memory configuration validation."""
+        mock_backend.validate_config.return_value = {"valid": True}
+        
+        client = QETLClient(mode="local")
+        config = {"pipeline_name": "test"}
+        result = client.validate_config(config)
+        
+        assert result["valid"] is True
+        assert mock_backend.validate_config.call_count == 1
+        assert mock_backend.validate_config.call_args == call(config)
+    
+    def test_get_instance_info(self, mock_runner):
+        """Test instance info is cached until refreshed."""
+        calls = []
+        mock_runner.return_value = SimpleNamespace(
+            get_instance_info=lambda *args, **kwargs: calls.append((args, kwargs)) or {"mode": "local"}
+        )
+        
+        client = QETLClient(mode="local")
+        info = client.get_instance_info()
+        client.get_instance_info()
+        assert info["mode"] == "local"
+        assert calls == [((), {})]
+        
+        client.get_instance_info(refresh=True)
+        assert calls == [((), {}), ((), {})]
     
     def test_context_manager(self):
         """Test client as context manager."""
-        with patch('qetl_sdk.client.LocalRunner') as mock_runner:
-            mock_backend = Mock()
-            mock_runner.return_value = mock_backend
-            
-            with QETLClient(mode="local") as client:
-                assert client.mode == "local"
-            
-            # Context manager should work without errors
+        with QETLClient(mode="local") as client:
+            assert client.mode == "local"
+        
+        # Context manager should work without errors
     
     def test_create_job_builder(self):
         """Test job builder creation."""
-        with patch('qetl_sdk.client.LocalRunner'):
-            client = QETLClient(mode="local")
-            builder = client.create_job_builder()
-            
-            assert builder is not None
-            assert builder._client is client
+        client = QETLClient(mode="local")
+        builder = client.create_job_builder()
+        
+        assert builder is not None
+        assert builder._client is client
@@ -0,0 +1,281 @@
+"""
+Tests for Job status tracking
+"""
+
+import asyncio
+import json
+import threading
+from datetime import datetime
+from unittest.mock import Mock, call, patch
+
+import pytest
+
+from qetl_sdk.job import (
+    Job, JobResults, JobStatus, JobState, RUNNING_STATES, TERMINAL_STATES, _PollBackoff
+)
+
+
+def make_backend(*states):
+    """Create a mock backend returning the given states in order."""
+    backend = Mock()
+    backend.get_job_status.side_effect = [
+        JobStatus(job_id="job-1", state=state, progress=progress)
+        for state, progress in states
+    ]
+    return backend
+
+
+class TestJob:
+    """Test cases for Job."""
+    
+    def test_watch_yields_changes_until_terminal(self):
+        """Test watch() yields each distinct status and stops when done."""
+        backend = make_backend(
+            (JobState.RUNNING, 40.0),
+            (JobState.RUNNING, 40.0),
+            (JobState.RUNNING, 80.0),
+            (JobState.COMPLETED, 100.0),
+        )
+        job = Job("job-1", backend)
+        
+        async def collect():
+            return [status async for status in job.watch(interval=0)]
+        
+        statuses = asyncio.run(collect())
+        
+        assert [s.progress for s in statuses] == [40.0, 80.0, 100.0]
+        assert statuses[-1].state == JobState.COMPLETED
+        assert backend.get_job_status.call_count == 4
+    
+    def test_job_status_is_immutable(self):
+        """Test JobStatus rejects changes and memoizes to_dict()."""
+        status = JobStatus(job_id="job-1", state=JobState.RUNNING, progress=50.0)
+        
+        with pytest.raises(AttributeError):
+            status.progress = 60.0
+        
+        data = status.to_dict()
+        data["progress"] = 60.0
+        assert status.to_dict()["progress"] == 50.0
+        assert status.to_dict() == status.to_dict()
+    
+    def test_job_state_is_terminal(self):
+        """Test terminal state detection on JobState."""
+        for state in JobState:
+            assert state.is_terminal == (state in TERMINAL_STATES)
+        assert JobState.CANCELLED.is_terminal
+        assert not JobState.RUNNING.is_terminal
+    
+    def test_job_status_state_checks(self):
+        """Test JobStatus state predicates agree with the state sets."""
+        for state in JobState:
+            status = JobStatus(job_id="job-1", state=state)
+            assert status.is_terminal == (state in TERMINAL_STATES)
+            assert status.is_running == (state in RUNNING_STATES)
+        assert not TERMINAL_STATES & RUNNING_STATES
+    
+    def test_poll_backoff_grows_and_resets(self):
+        """Test the polling interval backs off and resets on progress."""
+        backoff = _PollBackoff(initial=0.1, max_interval=0.3, multiplier=2.0, jitter=0)
+        running = JobStatus(job_id="job-1", state=JobState.RUNNING, progress=10.0)
+        
+        assert backoff.next_delay(running) == 0.1
+        assert backoff.next_delay(running) == 0.2
+        assert backoff.next_delay(running) == 0.3
+        assert backoff.next_delay(running) == 0.3
+        
+        progressed = JobStatus(job_id="job-1", state=JobState.RUNNING, progress=20.0)
+        assert backoff.next_delay(progressed) == 0.1
+    
+    @patch('qetl_sdk.job.time.sleep')
+    def test_wait_until_complete_backs_off(self, mock_sleep):
+        """Test wait_until_complete polls with growing intervals."""
+        backend = make_backend(
+            (JobState.RUNNING, 50.0),
+            (JobState.RUNNING, 50.0),
+            (JobState.RUNNING, 50.0),
+            (JobState.COMPLETED, 100.0),
+        )
+        job = Job("job-1", backend)
+        
+        with patch('qetl_sdk.job.random.uniform', return_value=0):
+            status = job.wait_until_complete()
+        
+        assert status.state == JobState.COMPLETED
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        assert delays[0] < delays[1] < delays[2]
+    
+    @patch('qetl_sdk.job.time.sleep')
+    def test_get_results_refreshes_status(self, mock_sleep):
+        """Test get_results keeps polling until the job finishes."""
+        backend = make_backend(
+            (JobState.RUNNING, 50.0),
+            (JobState.COMPLETED, 100.0),
+        )
+        backend.get_job_results.return_value = Mock(outputs={})
+        job = Job("job-1", backend)
+        
+        results = job.get_results()
+        
+        assert results is backend.get_job_results.return_value
+        assert backend.get_job_status.call_count == 2
+    
+    def test_get_status_skips_backend_once_terminal(self):
+        """Test a terminal status is not fetched again."""
+        backend = make_backend((JobState.FAILED, 0.0))
+        job = Job("job-1", backend)
+        
+        assert job.get_status().state == JobState.FAILED
+        assert job.get_status().state == JobState.FAILED
+        assert job.is_complete()
+        assert backend.get_job_status.call_count == 1
+    
+    @patch('qetl_sdk.job.time.sleep')
+    def test_wait_uses_backend_notification(self, mock_sleep):
+        """Test waiting relies on add_done_callback instead of polling."""
+        class NotifyingBackend:
+            def __init__(self):
+                self.finished = set()
+            
+            def get_job_status(self, job_id):
+                if job_id in self.finished:
+                    return JobStatus(job_id=job_id, state=JobState.COMPLETED)
+                return JobStatus(job_id=job_id, state=JobState.RUNNING)
+            
+            def add_done_callback(self, job_id, callback):
+                # Finish the job as soon as someone waits on it
+                self.finished.add(job_id)
+                callback()
+        
+        backend = NotifyingBackend()
+        job = Job("job-1", backend)
+        
+        status = job.wait_until_complete(timeout=5)
+        assert status.state == JobState.COMPLETED
+        
+        async def wait_async():
+            return await Job("job-2", backend)._wait_terminal_async(5, 0.1, 5.0)
+        
+        assert asyncio.run(wait_async()).state == JobState.COMPLETED
+        assert mock_sleep.call_count == 0
+    
+    def test_results_save_to_file(self, tmp_path):
+        """Test results are written as indented JSON."""
+        results = JobResults(
+            job_id="job-1",
+            outputs={"finished_at": datetime(2024, 1, 2, 3, 4, 5)},
+            execution_time=1.5,
+            logs=["done"]
+        )
+        path = tmp_path / "results.json"
+        
+        results.save_to_file(path)
+        
+        text = path.read_text()
+        assert text.startswith("{\n  ")
+        assert json.loads(text) == {
+            "job_id": "job-1",
+            "outputs": {"finished_at": "2024-01-02T03:04:05"},
+            "execution_time": 1.5,
+            "logs": ["done"],
+            "metrics": {}
+        }
+    
+    def test_on_completion_fetches_results_once(self):
+        """Test callbacks on a finished job share one results fetch."""
+        backend = make_backend((JobState.COMPLETED, 100.0))
+        job = Job("job-1", backend)
+        called = threading.Barrier(3)
+        first = Mock(side_effect=lambda results: called.wait(5))
+        second = Mock(side_effect=lambda results: called.wait(5))
+        
+        job.on_completion(first)
+        job.on_completion(second)
+        called.wait(5)
+        
+        results = backend.get_job_results.return_value
+        assert first.call_count == 1
+        assert first.call_args == call(results)
+        assert second.call_count == 1
+        assert second.call_args == call(results)
+        assert backend.get_job_results.call_count == 1
+        assert backend.get_job_results.call_args == call("job-1")
+        assert backend.get_job_status.call_count == 1
+    
+    def test_on_completion_concurrent_registration(self):
+        """Test callbacks registered from many threads each fire exactly once."""
+        backend = make_backend((JobState.COMPLETED, 100.0))
+        job = Job("job-1", backend)
+        fired = threading.Semaphore(0)
+        start = threading.Barrier(8)
+        
+        def register():
+            start.wait(5)
+            for _ in range(50):
+                job.on_completion(lambda results: fired.release())
+        
+        threads = [threading.Thread(target=register) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        
+        for _ in range(8 * 50):
+            assert fired.acquire(timeout=5)
+        assert not fired.acquire(timeout=0.1)
+    
+    def test_on_completion_runs_off_the_calling_thread(self):
+        """Test completion callbacks are fired by the backend on a worker thread."""
+        class NotifyingBackend:
+            def __init__(self):
+                self.finished = False
+                self.done_callbacks = []
+            
+            def get_job_status(self, job_id):
+                state = JobState.COMPLETED if self.finished else JobState.RUNNING
+                return JobStatus(job_id=job_id, state=state)
+            
+            def get_job_results(self, job_id):
+                return JobResults(job_id=job_id, outputs={"status": "completed"})
+            
+            def add_done_callback(self, job_id, callback):
+                self.done_callbacks.append(callback)
+        
+        backend = NotifyingBackend()
+        job = Job("job-1", backend)
+        fired = threading.Event()
+        threads = []
+        
+        def callback(results):
+            threads.append((threading.current_thread(), results))
+            fired.set()
+        
+        job.on_completion(callback)
+        assert not fired.is_set()
+        
+        backend.finished = True
+        for done in backend.done_callbacks:
+            done()
+        
+        assert fired.wait(5)
+        thread, results = threads[0]
+        assert thread is not threading.current_thread()
+        assert results.outputs == {"status": "completed"}
+    
+    def test_on_completion_schedules_coroutines_on_the_loop(self):
+        """Test coroutine callbacks run on the registering event loop."""
+        backend = make_backend((JobState.FAILED, 0.0))
+        job = Job("job-1", backend)
+        
+        async def register_and_wait():
+            fired = asyncio.Event()
+            
+            async def callback(results):
+                assert results is None
+                fired.set()
+            
+            job.on_completion(callback)
+            await asyncio.wait_for(fired.wait(), 5)
+        
+        asyncio.run(register_and_wait())
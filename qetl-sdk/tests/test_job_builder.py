@@ -3,265 +3,407 @@ Tests for JobBuilder
 """
 
 import pytest
-import tempfile
-import yaml
-from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, call
 
+from qetl_sdk._yaml import safe_load
 from qetl_sdk.builder import JobBuilder
+from qetl_sdk.client import QETLClient
 from qetl_sdk.exceptions import ValidationError
 
 
+@pytest.fixture(scope="module")
+def spec_client():
+    """Client stub shared by tests that never configure or inspect it."""
+    return Mock(spec=QETLClient)
+
+
+@pytest.fixture
+def mock_client():
+    """Client mock for tests that assert on submissions."""
+    return Mock(spec=QETLClient)
+
+
+@pytest.fixture(scope="module")
+def module_builder(spec_client):
+    """Builder shared by the tests in this module."""
+    return JobBuilder(spec_client)
+
+
+@pytest.fixture
+def builder(module_builder):
+    """The shared builder, reset to its default configuration."""
+    return module_builder.reset()
+
+
 class TestJobBuilder:
     """Test cases for JobBuilder."""
     
-    def setup_method(self):
-        """Setup for each test."""
-        self.mock_client = Mock()
-        self.builder = JobBuilder(self.mock_client)
-    
-    def test_init(self):
+    def test_init(self, builder):
         """Test builder initialization."""
-        assert self.builder._client is not None
-        assert self.builder._config["pipeline_name"] == "Programmatic Pipeline"
-        assert isinstance(self.builder._config["input_sources"], list)
-        assert isinstance(self.builder._config["transformations"], list)
+        assert builder._client is not None
+        assert builder._config["pipeline_name"] == "Programmatic Pipeline"
+        assert isinstance(builder._config["input_sources"], list)
+        assert isinstance(builder._config["transformations"], list)
+    
+    def test_builder_has_slots(self, spec_client):
+        """Test builders carry no per-instance __dict__."""
+        builder = JobBuilder(spec_client)
+        
+        assert not hasattr(builder, "__dict__")
+        assert not hasattr(builder.clone(), "__dict__")
+        with pytest.raises(AttributeError):
+            builder.unexpected = True
     
-    def test_set_name(self):
+    def test_set_name(self, builder):
         """Test setting pipeline name."""
-        result = self.builder.set_name("Test Pipeline")
+        result = builder.set_name("Test Pipeline")
         
-        assert result is self.builder  # Check fluent interface
-        assert self.builder._config["pipeline_name"] == "Test Pipeline"
+        assert result is builder  # Check fluent interface
+        assert builder._config["pipeline_name"] == "Test Pipeline"
     
-    def test_set_version(self):
+    def test_set_version(self, builder):
         """Test setting pipeline version."""
-        self.builder.set_version("2.0")
-        assert self.builder._config["version"] == "2.0"
+        builder.set_version("2.0")
+        assert builder._config["version"] == "2.0"
     
-    def test_set_description(self):
+    def test_set_description(self, builder):
         """Test setting pipeline description."""
-        self.builder.set_description("Test description")
-        assert self.builder._config["description"] == "Test description"
+        builder.set_description("Test description")
+        assert builder._config["description"] == "Test description"
     
-    def test_add_input_source(self):
-        """Test adding input source."""
-        self.builder.add_input_source("test_input", "/path/to/data.csv", "csv")
-        
-        sources = self.builder._config["input_sources"]
-        assert len(sources) == 1
-        assert sources[0]["name"] == "test_input"
-        assert sources[0]["path"] == "/path/to/data.csv"
-        assert sources[0]["type"] == "csv"
-    
-    def test_add_input_source_with_config(self):
+    def test_add_input_source_with_config(self, builder):
         """Test adding input source with configuration."""
         config = {"delimiter": ",", "header": True}
-        self.builder.add_input_source("test_input", "/path/to/data.csv", config=config)
+        builder.add_input_source("test_input", "/path/to/data.csv", config=config)
         
-        sources = self.builder._config["input_sources"]
+        sources = builder._config["input_sources"]
         assert sources[0]["config"] == config
     
-    def test_add_transformation(self):
-        """Test adding transformation."""
-        self.builder.add_transformation("test_component", {"param": "value"})
-        
-        transforms = self.builder._config["transformations"]
-        assert len(transforms) == 1
-        assert transforms[0]["component"] == "test_component"
-        assert transforms[0]["config"] == {"param": "value"}
-    
-    def test_add_transformation_with_dependencies(self):
+    def test_add_transformation_with_dependencies(self, builder):
         """Test adding transformation with dependencies."""
-        self.builder.add_transformation("comp1", name="transform1")
-        self.builder.add_transformation("comp2", name="transform2", dependencies=["transform1"])
+        builder.add_transformation("comp1", name="transform1")
+        builder.add_transformation("comp2", name="transform2", dependencies=["transform1"])
         
-        transforms = self.builder._config["transformations"]
+        transforms = builder._config["transformations"]
         assert len(transforms) == 2
         assert transforms[1]["dependencies"] == ["transform1"]
     
-    def test_add_output(self):
+    def test_add_output(self, builder):
         """Test adding output configuration."""
-        self.builder.add_output("results", "/path/to/output.json", "json")
+        builder.add_output("results", "/path/to/output.json", "json")
         
-        outputs = self.builder._config["outputs"]
+        outputs = builder._config["outputs"]
         assert len(outputs) == 1
         assert outputs[0]["name"] == "results"
         assert outputs[0]["path"] == "/path/to/output.json"
         assert outputs[0]["format"] == "json"
     
-    def test_set_execution_params(self):
-        """Test setting execution parameters."""
-        self.builder.set_execution_params(priority=80, timeout=7200)
+    def test_extend(self, builder):
+        """Test bulk addition of sources, transformations and outputs."""
+        result = (builder
+                  .extend_input_sources([{"name": "in1", "path": "/a.csv"}, {"name": "in2", "path": "/b.csv"}])
+                  .extend_transformations(
+                      {"component": f"comp{i}", "name": f"t{i}"} for i in range(3)
+                  )
+                  .add_transformation("final", dependencies=["t2"])
+                  .extend_outputs([{"name": "out1", "path": "/out.json", "format": "json"}]))
         
-        assert self.builder._execution_params["priority"] == 80
-        assert self.builder._execution_params["timeout"] == 7200
+        assert result is builder
+        assert len(builder._config["input_sources"]) == 2
+        assert len(builder._config["transformations"]) == 4
+        assert len(builder._config["outputs"]) == 1
+        assert builder.validate() is True
     
-    def test_add_quantum_homology_analyzer(self):
-        """Test convenience method for quantum homology analyzer."""
-        self.builder.add_quantum_homology_analyzer(dimensions=6, precision="high")
-        
-        transforms = self.builder._config["transformations"]
-        assert len(transforms) == 1
-        assert transforms[0]["component"] == "quantum_homology_analyzer"
-        assert transforms[0]["config"]["dimensions"] == 6
-        assert transforms[0]["config"]["precision"] == "high"
-    
-    def test_add_williams_pebbler(self):
-        """Test convenience method for Williams pebbler."""
-        self.builder.add_williams_pebbler(optimization_level=3)
-        
-        transforms = self.builder._config["transformations"]
-        assert len(transforms) == 1
-        assert transforms[0]["component"] == "williams_pebbler"
-        assert transforms[0]["config"]["optimization_level"] == 3
-    
-    def test_add_holographic_grover(self):
-        """Test convenience method for holographic Grover."""
-        self.builder.add_holographic_grover(search_iterations=2000)
-        
-        transforms = self.builder._config["transformations"]
-        assert len(transforms) == 1
-        assert transforms[0]["component"] == "holographic_grover"
-        assert transforms[0]["config"]["search_iterations"] == 2000
-    
-    def test_add_wave_encoder(self):
-        """Test convenience method for wave encoder."""
-        self.builder.add_wave_encoder(encoding_type="molecular_orbital")
-        
-        transforms = self.builder._config["transformations"]
-        assert len(transforms) == 1
-        assert transforms[0]["component"] == "wave_encoder"
-        assert transforms[0]["config"]["encoding_type"] == "molecular_orbital"
+    def test_set_execution_params(self, builder):
+        """Test setting execution parameters."""
+        builder.set_execution_params(priority=80, timeout=7200)
+        
+        assert builder._execution_params["priority"] == 80
+        assert builder._execution_params["timeout"] == 7200
     
-    def test_add_wave_decoder(self):
-        """Test convenience method for wave decoder."""
-        self.builder.add_wave_decoder(decoding_type="quantum_fourier")
-        
-        transforms = self.builder._config["transformations"]
-        assert len(transforms) == 1
-        assert transforms[0]["component"] == "wave_decoder"
-        assert transforms[0]["config"]["decoding_type"] == "quantum_fourier"
+    @pytest.mark.parametrize("method,kwargs,section,expected", [
+        ("add_input_source",
+         {"name": "test_input", "path": "/path/to/data.csv", "source_type": "csv"},
+         "input_sources",
+         {"name": "test_input", "path": "/path/to/data.csv", "type": "csv"}),
+        ("add_transformation",
+         {"component": "test_component", "config": {"param": "value"}},
+         "transformations",
+         {"component": "test_component", "config": {"param": "value"}}),
+        ("add_quantum_homology_analyzer",
+         {"dimensions": 6, "precision": "high"},
+         "transformations",
+         {"component": "quantum_homology_analyzer",
+          "config": {"dimensions": 6, "precision": "high"}}),
+        ("add_williams_pebbler",
+         {"optimization_level": 3},
+         "transformations",
+         {"component": "williams_pebbler", "config": {"optimization_level": 3}}),
+        ("add_holographic_grover",
+         {"search_iterations": 2000},
+         "transformations",
+         {"component": "holographic_grover", "config": {"search_iterations": 2000}}),
+        ("add_wave_encoder",
+         {"encoding_type": "molecular_orbital"},
+         "transformations",
+         {"component": "wave_encoder", "config": {"encoding_type": "molecular_orbital"}}),
+        ("add_wave_decoder",
+         {"decoding_type": "quantum_fourier"},
+         "transformations",
+         {"component": "wave_decoder", "config": {"decoding_type": "quantum_fourier"}}),
+    ])
+    def test_add_methods(self, builder, method, kwargs, section, expected):
+        """Test the single-entry add methods, including the component shortcuts."""
+        getattr(builder, method)(**kwargs)
+        
+        entries = builder._config[section]
+        assert len(entries) == 1
+        for key, value in expected.items():
+            assert entries[0][key] == value
     
-    def test_validate_valid_config(self):
+    def test_validate_valid_config(self, builder):
         """Test validation of valid configuration."""
-        self.builder.add_input_source("input1", "/path/data.csv")
-        self.builder.add_transformation("test_component")
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("test_component")
         
-        result = self.builder.validate()
+        result = builder.validate()
         assert result is True
     
-    def test_validate_missing_input(self):
+    def test_validate_missing_input(self, builder):
         """Test validation with missing input sources."""
-        self.builder.add_transformation("test_component")
+        builder.add_transformation("test_component")
         
         with pytest.raises(ValidationError) as exc_info:
-            self.builder.validate()
+            builder.validate()
         
         assert "input source" in str(exc_info.value)
     
-    def test_validate_missing_transformations(self):
+    def test_validate_missing_transformations(self, builder):
         """Test validation with missing transformations."""
-        self.builder.add_input_source("input1", "/path/data.csv")
+        builder.add_input_source("input1", "/path/data.csv")
         
         with pytest.raises(ValidationError) as exc_info:
-            self.builder.validate()
+            builder.validate()
         
         assert "transformation" in str(exc_info.value)
     
-    def test_validate_unknown_dependency(self):
+    def test_validate_unknown_dependency(self, builder):
         """Test validation with unknown dependency."""
-        self.builder.add_input_source("input1", "/path/data.csv")
-        self.builder.add_transformation("comp1", dependencies=["unknown_transform"])
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("comp1", dependencies=["unknown_transform"])
         
         with pytest.raises(ValidationError) as exc_info:
-            self.builder.validate()
+            builder.validate()
         
         assert "Unknown dependency" in str(exc_info.value)
     
-    def test_to_yaml(self):
+    def test_validate_many_transformations(self, builder):
+        """Test dependency validation over a long transformation chain."""
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("comp", name="t0")
+        for i in range(1, 1000):
+            builder.add_transformation("comp", name=f"t{i}", dependencies=[f"t{i - 1}"])
+        
+        assert builder.validate() is True
+        
+        builder.add_transformation("comp", dependencies=["t999", "t1000"])
+        with pytest.raises(ValidationError, match="Unknown dependency: t1000$"):
+            builder.validate()
+
+    def test_validate_dependency_after_clone_and_from_config(self, builder, spec_client):
+        """Test known transformation names carry over to derived builders."""
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("comp1", name="t1")
+        
+        cloned = builder.clone().add_transformation("comp2", dependencies=["t1"])
+        assert cloned.validate() is True
+        
+        rebuilt = JobBuilder.from_config(spec_client, builder.get_config())
+        rebuilt.add_transformation("comp2", dependencies=["t1"])
+        assert rebuilt.validate() is True
+    
+    def test_to_yaml(self, builder):
         """Test YAML export."""
-        self.builder.add_input_source("input1", "/path/data.csv")
-        self.builder.add_transformation("test_component")
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("test_component")
         
-        yaml_str = self.builder.to_yaml()
+        yaml_str = builder.to_yaml()
         assert isinstance(yaml_str, str)
         
         # Parse YAML to verify structure
-        config = yaml.safe_load(yaml_str)
+        config = safe_load(yaml_str)
         assert config["pipeline_name"] == "Programmatic Pipeline"
         assert len(config["input_sources"]) == 1
         assert len(config["transformations"]) == 1
     
-    def test_save_yaml(self):
+    def test_to_yaml_cached(self, builder):
+        """Test repeated YAML exports reuse the cached string."""
+        builder.add_input_source("input1", "/path/data.csv")
+        
+        assert builder.to_yaml() is builder.to_yaml()
+
+    def test_to_yaml_reflects_later_changes(self, builder):
+        """Test YAML export is regenerated after the builder changes."""
+        builder.add_input_source("input1", "/path/data.csv")
+        first = builder.to_yaml()
+        
+        builder.set_name("Renamed Pipeline")
+        second = builder.to_yaml()
+        
+        assert first != second
+        assert safe_load(second)["pipeline_name"] == "Renamed Pipeline"
+
+    def test_to_yaml_tuple_dependencies(self, builder):
+        """Test tuples are exported as YAML lists."""
+        builder.add_transformation("comp1", name="t1")
+        builder.add_transformation("comp2", name="t2", dependencies=("t1",))
+        
+        config = safe_load(builder.to_yaml())
+        assert config["transformations"][1]["dependencies"] == ["t1"]
+    
+    def test_to_yaml_stream(self, builder):
+        """Test in-memory YAML export."""
+        builder.add_input_source("input1", "/path/data.csv")
+        
+        stream = builder.to_yaml_stream()
+        
+        assert stream.tell() == 0
+        assert safe_load(stream) == safe_load(builder.to_yaml())
+    
+    def test_save_yaml(self, builder, tmp_path):
         """Test saving YAML to file."""
-        self.builder.add_input_source("input1", "/path/data.csv")
-        self.builder.add_transformation("test_component")
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            filepath = Path(f.name)
-        
-        try:
-            result_path = self.builder.save_yaml(filepath)
-            assert result_path == filepath
-            assert filepath.exists()
-            
-            # Verify content
-            with open(filepath, 'r') as f:
-                config = yaml.safe_load(f)
-            
-            assert config["pipeline_name"] == "Programmatic Pipeline"
-        finally:
-            if filepath.exists():
-                filepath.unlink()
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("test_component")
+        
+        filepath = tmp_path / "pipeline.yaml"
+        result_path = builder.save_yaml(filepath)
+        assert result_path == filepath
+        assert filepath.exists()
+        
+        # Verify content
+        config = safe_load(filepath.read_bytes())
+        
+        assert config["pipeline_name"] == "Programmatic Pipeline"
     
-    def test_submit(self):
+    def test_submit(self, mock_client):
         """Test job submission."""
-        self.builder.add_input_source("input1", "/path/data.csv")
-        self.builder.add_transformation("test_component")
+        builder = JobBuilder(mock_client)
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("test_component")
+        
+        builder.set_execution_params(priority=80)
         
         mock_job = Mock()
-        self.mock_client.submit_job.return_value = mock_job
+        mock_client.submit_job_config.return_value = mock_job
         
-        job = self.builder.submit()
+        job = builder.submit()
         
         assert job is mock_job
-        self.mock_client.submit_job.assert_called_once()
+        assert mock_client.submit_job_config.call_count == 1
+        assert mock_client.submit_job_config.call_args == call(
+            builder.get_config(), priority=80, timeout=3600
+        )
+        assert mock_client.submit_job.call_count == 0
+    
+    def test_reset(self, builder):
+        """Test resetting a builder back to the defaults."""
+        builder.set_name("Used Pipeline")
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("comp1", name="t1")
+        builder.set_execution_params(priority=90)
+        before = builder.to_yaml()
+        
+        assert builder.reset() is builder
+        assert builder.get_config() == JobBuilder(builder._client).get_config()
+        assert builder.to_yaml() != before
+        
+        builder.add_transformation("comp2", dependencies=["t1"])
+        with pytest.raises(ValidationError, match="Unknown dependency: t1"):
+            builder.validate()
     
-    def test_clone(self):
+    def test_clone(self, builder):
         """Test builder cloning."""
-        self.builder.set_name("Original Pipeline")
-        self.builder.add_input_source("input1", "/path/data.csv")
+        builder.set_name("Original Pipeline")
+        builder.add_input_source("input1", "/path/data.csv")
         
-        cloned = self.builder.clone()
+        cloned = builder.clone()
         
-        assert cloned is not self.builder
+        assert cloned is not builder
         assert cloned._config["pipeline_name"] == "Original Pipeline"
         assert len(cloned._config["input_sources"]) == 1
     
-    def test_get_config(self):
+    def test_clone_is_independent(self, builder):
+        """Test changes to a clone don't leak back into the original."""
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("comp1", {"param": "value"})
+        
+        cloned = builder.clone()
+        cloned.add_input_source("input2", "/path/more.csv")
+        cloned._config["transformations"][0]["config"]["param"] = "changed"
+        
+        assert len(builder._config["input_sources"]) == 1
+        assert builder._config["transformations"][0]["config"]["param"] == "value"
+    
+    def test_get_config(self, builder):
         """Test getting current configuration."""
-        self.builder.add_input_source("input1", "/path/data.csv")
-        self.builder.set_execution_params(priority=90)
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.set_execution_params(priority=90)
         
-        config = self.builder.get_config()
+        config = builder.get_config()
         
         assert config["pipeline_name"] == "Programmatic Pipeline"
         assert len(config["input_sources"]) == 1
         assert config["execution"]["priority"] == 90
     
-    def test_fluent_interface(self):
+    def test_from_config(self, builder, spec_client):
+        """Test creating a builder from a configuration dictionary."""
+        builder.set_name("Template")
+        builder.add_input_source("input1", "/path/data.csv")
+        builder.add_transformation("comp1", name="t1")
+        builder.set_execution_params(priority=70)
+        template = builder.get_config()
+        
+        built = JobBuilder.from_config(spec_client, template)
+        built.add_output("out1", "/path/output.json")
+        
+        assert built.get_config()["pipeline_name"] == "Template"
+        assert built.get_config()["execution"]["priority"] == 70
+        assert len(built.get_config()["outputs"]) == 1
+        assert builder.get_config()["outputs"] == []
+        assert built.validate() is True
+    
+    def test_fluent_interface(self, builder):
         """Test fluent interface chaining."""
-        result = (self.builder
+        result = (builder
                  .set_name("Chained Pipeline")
                  .set_version("1.5")
                  .add_input_source("input1", "/path/data.csv")
                  .add_transformation("comp1")
                  .add_output("out1", "/path/output.json"))
         
-        assert result is self.builder
-        assert self.builder._config["pipeline_name"] == "Chained Pipeline"
-        assert self.builder._config["version"] == "1.5"
-        assert len(self.builder._config["input_sources"]) == 1
-        assert len(self.builder._config["transformations"]) == 1
-        assert len(self.builder._config["outputs"]) == 1
+        assert result is builder
+        assert builder._config["pipeline_name"] == "Chained Pipeline"
+        assert builder._config["version"] == "1.5"
+        assert len(builder._config["input_sources"]) == 1
+        assert len(builder._config["transformations"]) == 1
+        assert len(builder._config["outputs"]) == 1
+    
+    def test_configure(self, builder):
+        """Test setting several fields in one call."""
+        result = builder.configure(
+            name="Configured Pipeline",
+            version="1.5",
+            input_sources=[{"name": "input1", "path": "/path/data.csv"}],
+            transformations=[{"component": "comp1", "name": "t1"}],
+            outputs=[{"name": "out1", "path": "/path/output.json", "format": "json"}]
+        )
+        
+        assert result is builder
+        assert builder._config["pipeline_name"] == "Configured Pipeline"
+        assert builder._config["version"] == "1.5"
+        assert "description" not in builder._config
+        assert len(builder._config["input_sources"]) == 1
+        assert len(builder._config["outputs"]) == 1
+        
+        builder.add_transformation("comp2", dependencies=["t1"])
+        assert builder.validate() is True
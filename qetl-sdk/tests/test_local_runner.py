@@ -0,0 +1,159 @@
+"""
+Tests for LocalRunner
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from qetl_sdk import _yaml
+from qetl_sdk._yaml import safe_dump
+from qetl_sdk.exceptions import ConfigurationError
+from qetl_sdk.job import JobState
+from qetl_sdk.local_runner import LocalRunner, _LogBuffer
+
+
+PIPELINE_CONFIG = {
+    "pipeline_name": "test",
+    "input_sources": [{"type": "wave_encoder"}],
+    "transformations": [{"type": "qfft"}],
+}
+
+
+@pytest.fixture
+def qetl_home(tmp_path):
+    """Minimal QETL installation layout accepted by LocalRunner."""
+    (tmp_path / "core").mkdir()
+    (tmp_path / "core" / "quantum_mathematics_engine.py").write_text("")
+    (tmp_path / "yaml_pipeline_runner").mkdir()
+    (tmp_path / "yaml_pipeline_runner" / "__init__.py").write_text("")
+    (tmp_path / "yaml_pipeline_runner" / "main.py").write_text("")
+    return tmp_path
+
+
+@pytest.fixture
+def runner(qetl_home):
+    """Runner for the fake installation, shut down after the test."""
+    runner = LocalRunner(qetl_home=str(qetl_home), prewarm=False)
+    yield runner
+    runner.cleanup()
+
+
+class TestLocalRunner:
+    """Test cases for LocalRunner."""
+    
+    def test_find_qetl_home(self, qetl_home, tmp_path_factory, monkeypatch):
+        """Test an installation created after a failed search is still found."""
+        monkeypatch.delenv("QETL_HOME", raising=False)
+        missing = tmp_path_factory.mktemp("missing")
+        monkeypatch.chdir(missing)
+        
+        with pytest.raises(ConfigurationError, match="QETL installation not found"):
+            LocalRunner(prewarm=False)
+        
+        # A failed search is not remembered
+        for path in qetl_home.iterdir():
+            path.rename(missing / path.name)
+        
+        runner = LocalRunner(prewarm=False)
+        runner.cleanup()
+        assert runner.qetl_home == missing
+    
+    def test_parse_output_line_events(self, runner):
+        """Test runner events are applied and kept out of the logs."""
+        outputs = {}
+        logs = _LogBuffer(maxlen=10)
+        progress = []
+        
+        lines = [
+            'QETL-EVENT: {"type": "progress", "pct": 57.3, "message": "Encoding"}',
+            'QETL-EVENT: {"type": "output", "name": "fidelity", "value": 0.98}',
+            'QETL-EVENT: {"type": "log", "msg": "circuit built"}',
+        ]
+        for line in lines:
+            assert runner._parse_output_line(line, outputs, logs, lambda *a: progress.append(a))
+        
+        assert progress == [(57.3, "Encoding")]
+        assert outputs == {"fidelity": 0.98}
+        assert logs.snapshot() == ["circuit built"]
+    
+    def test_parse_output_line_text(self, runner):
+        """Test plain and malformed event lines are logged and scanned for markers."""
+        outputs = {}
+        logs = _LogBuffer(maxlen=10)
+        
+        lines = [
+            "QETL-EVENT: {not json",
+            "Processing complete",
+            "Results saved to /tmp/out.json",
+        ]
+        for line in lines:
+            assert not runner._parse_output_line(line, outputs, logs, lambda *a: None)
+        
+        assert outputs == {"status": "completed", "result_path": "/tmp/out.json"}
+        assert logs.snapshot() == lines
+    
+    def test_cancel_job_kills_running_pipeline(self, qetl_home):
+        """Test cancelling a running job frees its worker for the next job."""
+        runner = LocalRunner(qetl_home=str(qetl_home), prewarm=False, max_concurrency=1)
+        (qetl_home / "yaml_pipeline_runner" / "main.py").write_text(
+            "import sys, time\n"
+            "if 'slow' in open(sys.argv[2]).read():\n"
+            "    time.sleep(60)\n"
+        )
+        slow = runner.submit_job_config({**PIPELINE_CONFIG, "pipeline_name": "slow"})
+        fast = runner.submit_job_config(PIPELINE_CONFIG)
+        
+        deadline = time.monotonic() + 10
+        while not runner._processes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        try:
+            assert runner.cancel_job(slow.job_id)
+            assert fast.wait_until_complete(timeout=10).state == JobState.COMPLETED
+            assert slow.get_status().state == JobState.CANCELLED
+        finally:
+            runner.cleanup(kill_running=True)
+    
+    def test_cleanup_kill_running(self, runner, qetl_home):
+        """Test cleanup can kill running pipelines instead of waiting for them."""
+        (qetl_home / "yaml_pipeline_runner" / "main.py").write_text("import time\ntime.sleep(60)\n")
+        job = runner.submit_job_config(PIPELINE_CONFIG)
+        
+        deadline = time.monotonic() + 10
+        while not runner._processes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        runner.cleanup(kill_running=True)
+        status = job.wait_until_complete(timeout=10)
+        
+        assert status.state == JobState.FAILED
+    
+    def test_status_cache_skips_dropped_jobs(self, runner):
+        """Test reading a record evicted meanwhile doesn't re-add a cache entry."""
+        job = runner.submit_job_config(PIPELINE_CONFIG)
+        job.wait_until_complete(timeout=10)
+        job_data = runner.jobs[job.job_id]
+        
+        with runner._job_lock:
+            runner._drop_job(job.job_id)
+        status = runner._cached_status(job.job_id, job_data)
+        
+        assert status.state == JobState.COMPLETED
+        assert job.job_id not in runner._status_cache
+    
+    def test_validate_yaml_cached(self, runner, tmp_path, monkeypatch):
+        """Test validating an unchanged file parses it once and returns private copies."""
+        load = Mock(wraps=_yaml.load_config_file)
+        monkeypatch.setattr(_yaml, "load_config_file", load)
+        
+        yaml_path = tmp_path / "pipeline.yaml"
+        yaml_path.write_text(safe_dump(PIPELINE_CONFIG))
+        
+        first = runner.validate_yaml(yaml_path)
+        first["config"]["input_sources"][0]["type"] = "changed"
+        second = runner.validate_yaml(yaml_path)
+        
+        assert load.call_count == 1
+        assert second["config"] == PIPELINE_CONFIG